@@ -0,0 +1,63 @@
+# cython: language_level=3
+"""
+Cython kernel for the proportional redistribution rule (Equations 4-9)
+
+Same semantics as `load_redistribution.redistribute_sources_arrays`, over the CSR layout of
+the source neighbourhoods built by `load_redistribution.build_nk_csr`:
+  nk_off[s] .. nk_off[s+1]  slice of `nk_idx` holding N_k for the s-th source
+
+Optional: build in place with `cythonize -i _redistribute.pyx`. Without the compiled module
+`load_redistribution` keeps using its NumPy path.
+"""
+import numpy as np
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def redistribute_csr(double[:] loads, double[:] deg_pow, int[:] source_ids, int[:] nk_off, int[:] nk_idx):
+    """Return the new float64 loads array after simultaneously redistributing every source."""
+    cdef Py_ssize_t n = loads.shape[0]
+    cdef Py_ssize_t s, p, start, stop
+    cdef int k, j
+    cdef double Lk, denom, share
+
+    new_arr = np.empty(n, dtype=np.float64)
+    cdef double[:] new_loads = new_arr
+    cdef double[:] delta = np.zeros(n, dtype=np.float64)
+
+    for s in range(source_ids.shape[0]):
+        k = source_ids[s]
+        Lk = loads[k]
+        if Lk <= 0.0:
+            continue
+
+        start = nk_off[s]
+        stop = nk_off[s + 1]
+
+        denom = 0.0
+        for p in range(start, stop):
+            denom += deg_pow[nk_idx[p]]
+
+        if denom <= 0.0:
+            # evenly split among Nk
+            share = Lk / (stop - start)
+            for p in range(start, stop):
+                delta[nk_idx[p]] += share
+        else:
+            for p in range(start, stop):
+                j = nk_idx[p]
+                delta[j] += Lk * (deg_pow[j] / denom)
+
+    # remove each source's original full load, then add accumulated deltas
+    for p in range(n):
+        new_loads[p] = loads[p]
+    for s in range(source_ids.shape[0]):
+        k = source_ids[s]
+        new_loads[k] -= loads[k]
+    for p in range(n):
+        new_loads[p] += delta[p]
+
+    return new_arr
@@ -3,20 +3,58 @@ AFTM reliability model functions
 R(t,L) = exp(-lambda * t * L^alpha)
 F(t,L) = 1 - R(t,L)
 lambda(L) = lambda_base * L^alpha
+
+Every function accepts plain scalars or NumPy arrays. Scalars take a `math` fast path;
+array-like arguments are broadcast together and evaluated in one vectorized call, so
+callers can evaluate all switches (or a whole time sweep) without a Python loop.
 """
 import math
 
+import numpy as np
+
+
+def _all_scalar(*args):
+    return all(np.isscalar(a) for a in args)
+
+
 def lambda_L(base_lambda, L, alpha=1.0):
-    return base_lambda * (L ** alpha)
+    if _all_scalar(base_lambda, L, alpha):
+        return base_lambda * (L ** alpha)
+    return np.asarray(base_lambda, dtype=np.float64) * np.power(np.asarray(L, dtype=np.float64), alpha)
 
 
 def reliability_R(t, L, base_lambda, alpha=1.0):
-    """Return reliability R(t,L) = exp(-base_lambda * t * L^alpha)"""
+    """Return reliability R(t,L) = exp(-base_lambda * t * L^alpha)
+
+    `t`, `L`, `base_lambda` and `alpha` may be scalars or arrays (broadcast together).
+    Returns a float for all-scalar input, otherwise an `np.ndarray`.
+    """
+    if _all_scalar(t, L, base_lambda, alpha):
+        # Protect against negative or zero
+        if t < 0:
+            raise ValueError("Time t must be non-negative")
+        return math.exp(-lambda_L(base_lambda, L, alpha) * t)
+
+    t = np.asarray(t, dtype=np.float64)
+    if np.any(t < 0):
+        raise ValueError("Time t must be non-negative")
     lam = lambda_L(base_lambda, L, alpha)
-    # Protect against negative or zero
+    return np.exp(-lam * t)
+
+
+def precompute_lambda(L_array, base_lambda, alpha=1.0):
+    """Return the load-dependent rates lambda(L) = base_lambda * L^alpha as a float64 array.
+
+    Only depends on the loads, so it needs recomputing only when the loads change.
+    """
+    return np.asarray(lambda_L(base_lambda, L_array, alpha), dtype=np.float64)
+
+
+def reliability_from_lam(t, lam_array):
+    """Return R(t) = exp(-lam * t) for rates from `precompute_lambda` (no pow per call)."""
     if t < 0:
         raise ValueError("Time t must be non-negative")
-    return math.exp(-lam * t)
+    return np.exp(-lam_array * t)
 
 
 def failure_F(t, L, base_lambda, alpha=1.0):
@@ -24,4 +62,5 @@ def failure_F(t, L, base_lambda, alpha=1.0):
 
 
 if __name__ == "__main__":
-    print(reliability_R(1000, 10, 3e-6))
\ No newline at end of file
+    print(reliability_R(1000, 10, 3e-6))
+    print(reliability_R(1000, np.array([10.0, 20.0, 50.0]), 3e-6))
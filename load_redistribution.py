@@ -9,64 +9,250 @@ neighborhood N_k (including k). This follows the paper exactly: for each source
 all j ∈ N_k receive ΔL_jk = L_k * Π_j and the source's original L_k is removed before
 adding the Δ's (so the source keeps ΔL_kk but not its original L_k separately).
 """
+from dataclasses import dataclass, field, replace
 
-def proportional_redistribute_sources_full(loads, degrees, sources, neighbors_map, beta=1.0):
+import numpy as np
+
+try:
+    # optional compiled kernel, see _redistribute.pyx
+    from _redistribute import redistribute_csr
+except ImportError:
+    redistribute_csr = None
+
+
+def _nk(k, neigh):
+    """Return Nk = (k, *neigh) deduplicated, self first."""
+    Nk = (k, *neigh)
+    # usual case: neighbour lists hold no duplicates and not k itself, so a set size check suffices
+    if len(set(Nk)) == len(Nk):
+        return Nk
+    return tuple(dict.fromkeys(Nk))
+
+
+def precompute_nk(neighbors_map):
     """
-    Simultaneously redistribute the full load of each source in `sources`.
+    Return {k: Nk} with Nk = (k, *neighbors_map[k]) deduplicated, self first.
+
+    The neighbourhoods only depend on the graph, so callers that redistribute repeatedly on
+    the same topology should build this once and pass it as `nk_map`.
+    """
+    return {k: _nk(k, neigh) for k, neigh in (neighbors_map or {}).items()}
 
-    - `loads`: dict of current loads (pre-redistribution), used as the snapshot L_k values.
-    - `degrees`: dict mapping node -> degree used to compute Π (degree^beta).
-    - `sources`: iterable of source node names (Φ).
-    - `neighbors_map`: dict mapping node -> list of neighbor node names (not including self).
-    - `beta`: exponent for degree weighting (default 1.0).
 
-    Returns a new loads dict after redistribution.
+def _source_nk(sources, neighbors_map, nk_map):
+    """Return {k: Nk} for each source, read from `nk_map` or built from `neighbors_map`."""
+    if nk_map is not None:
+        return {k: nk_map.get(k, (k,)) for k in sources}
+    neighbors_map = neighbors_map or {}
+    return {k: _nk(k, neighbors_map.get(k, ())) for k in sources}
+
+
+def _degree_powers(loads, degrees, nks, beta):
+    """Return {node: degree^beta} for every node in `loads` or in any of the given Nk."""
+    nodes = set(loads)
+    for Nk in nks:
+        nodes.update(Nk)
+    # the paper's usual settings skip the generic pow
+    if beta == 0.0:
+        return dict.fromkeys(nodes, 1.0)
+    deg_f = {n: float(degrees.get(n, 0)) for n in nodes}
+    if beta == 1.0:
+        return deg_f
+    if beta == 2.0:
+        return {n: d * d for n, d in deg_f.items()}
+    return {n: d ** beta for n, d in deg_f.items()}
+
+
+def degree_powers_array(degrees, id_to_name, beta):
+    """Return float64 degree^beta per node id, following `id_to_name`."""
+    if beta == 0.0:
+        return np.ones(len(id_to_name), dtype=np.float64)
+    deg_arr = np.fromiter((float(degrees.get(n, 0)) for n in id_to_name), dtype=np.float64, count=len(id_to_name))
+    return _pow_beta(deg_arr, beta)
+
+
+def _pow_beta(deg_arr, beta):
+    """Return float64 `deg_arr`^beta, skipping the generic pow for beta 0, 1 and 2."""
+    deg_arr = np.asarray(deg_arr, dtype=np.float64)
+    if beta == 0.0:
+        return np.ones_like(deg_arr)
+    if beta == 1.0:
+        return deg_arr
+    if beta == 2.0:
+        return deg_arr * deg_arr
+    return deg_arr ** beta
+
+
+def build_index(loads, neighbors_map, nk_map=None):
     """
-    # snapshot of pre-redistribution loads
-    L_before = {k: float(v) for k, v in loads.items()}
+    Assign every node an integer id once and translate each node's Nk to an index array.
 
-    # prepare delta accumulator
-    delta_total = {n: 0.0 for n in loads.keys()}
+    Nodes from `loads` come first (in dict order); neighbours that only appear in
+    `neighbors_map` are appended after them so they can still receive load.
 
-    # compute per-source deltas using L_before (simultaneous application)
-    for k in sources:
-        if k not in L_before:
-            continue
-        Lk = float(L_before.get(k, 0.0))
-        if Lk <= 0.0:
-            continue
+    Returns `(name_to_id, id_to_name, nk_idx)` where `nk_idx[i]` is an `np.intp` array holding
+    Nk = {i} ∪ neighbours(i) (deduplicated, self first).
+    """
+    if nk_map is None:
+        nk_map = precompute_nk(neighbors_map)
 
-        # Nk includes k itself plus its neighbors (ensure unique order)
-        neigh = list(neighbors_map.get(k, [])) if neighbors_map is not None else []
-        Nk = list(dict.fromkeys([k] + neigh))
+    id_to_name = list(loads)
+    name_to_id = {n: i for i, n in enumerate(id_to_name)}
 
-        # compute denominator over Nk
-        denom = 0.0
+    for Nk in nk_map.values():
         for m in Nk:
-            denom += float(degrees.get(m, 0) ** beta)
+            if m not in name_to_id:
+                name_to_id[m] = len(id_to_name)
+                id_to_name.append(m)
+
+    nk_idx = {}
+    for n, i in list(name_to_id.items()):
+        Nk = nk_map.get(n, (n,))
+        nk_idx[i] = np.fromiter((name_to_id[m] for m in Nk), dtype=np.intp, count=len(Nk))
+
+    return name_to_id, id_to_name, nk_idx
+
+
+def build_nk_csr(source_ids, nk_idx):
+    """Pack the Nk index arrays of `source_ids` into CSR `(nk_offsets, nk_indices)` int32 arrays."""
+    nk_offsets = np.zeros(len(source_ids) + 1, dtype=np.int32)
+    for s, k in enumerate(source_ids):
+        nk_offsets[s + 1] = nk_offsets[s] + len(nk_idx[k])
+    if len(source_ids) > 0:
+        nk_indices = np.concatenate([nk_idx[k] for k in source_ids]).astype(np.int32)
+    else:
+        nk_indices = np.zeros(0, dtype=np.int32)
+    return nk_offsets, nk_indices
+
+
+def redistribute_sources_arrays(loads_arr, deg_pow_arr, source_ids, nk_idx):
+    """
+    Array form of `proportional_redistribute_sources_full` over a fixed node index.
+
+    - `loads_arr`: float64 loads indexed by node id (the L_before snapshot; not modified).
+    - `deg_pow_arr`: float64 degree^beta per node id.
+    - `source_ids`: int ids of the sources Φ.
+    - `nk_idx`: mapping id -> index array of Nk (see `build_index`).
 
+    Returns a new float64 loads array.
+    """
+    delta_arr = np.zeros_like(loads_arr)
+
+    for k in source_ids:
+        Lk = loads_arr[k]
+        if Lk <= 0.0:
+            continue
+
+        idx = nk_idx[k]
+        w = deg_pow_arr[idx]
+        denom = w.sum()
         if denom <= 0.0:
             # evenly split among Nk
-            for j in Nk:
-                delta_total[j] = delta_total.get(j, 0.0) + Lk / len(Nk)
+            delta_arr[idx] += Lk / len(idx)
         else:
-            for j in Nk:
-                w = float(degrees.get(j, 0) ** beta) / denom
-                delta_total[j] = delta_total.get(j, 0.0) + Lk * w
+            delta_arr[idx] += Lk * (w / denom)
 
-    # apply deltas: remove each source's original full load, then add accumulated deltas
-    new_loads = {n: float(v) for n, v in L_before.items()}
-    for k in sources:
-        if k in new_loads:
-            new_loads[k] = new_loads.get(k, 0.0) - float(L_before.get(k, 0.0))
+    # remove each source's original full load, then add accumulated deltas
+    new_arr = loads_arr.copy()
+    np.subtract.at(new_arr, source_ids, loads_arr[source_ids])
+    new_arr += delta_arr
+    return new_arr
 
-    for j, d in delta_total.items():
-        new_loads[j] = new_loads.get(j, 0.0) + float(d)
+
+def _redistribute(loads_arr, deg_pow_arr, source_ids, nk_idx):
+    """Run the compiled kernel when `_redistribute` is built, else `redistribute_sources_arrays`."""
+    if redistribute_csr is not None:
+        nk_offsets, nk_indices = build_nk_csr(source_ids, nk_idx)
+        return np.asarray(redistribute_csr(loads_arr, deg_pow_arr, source_ids.astype(np.int32),
+                                           nk_offsets, nk_indices))
+    return redistribute_sources_arrays(loads_arr, deg_pow_arr, source_ids, nk_idx)
+
+
+@dataclass
+class SwitchState:
+    """
+    Contiguous load state over a fixed node index (see `build_index`).
+
+    `loads` and `degrees` are indexed by node id; `nk_idx` maps id -> Nk index array.
+    degree^beta is cached per beta by `deg_pow`. `as_dict()` gives the legacy {name: load} view.
+    """
+    names: tuple
+    name_to_id: dict
+    loads: np.ndarray
+    degrees: np.ndarray
+    nk_idx: dict
+    _deg_pow: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_dicts(cls, loads, degrees, neighbors_map, nk_map=None):
+        """Build the state from the dict inputs of `proportional_redistribute_sources_full`."""
+        name_to_id, id_to_name, nk_idx = build_index(loads, neighbors_map, nk_map)
+        loads_arr = np.zeros(len(id_to_name), dtype=np.float64)
+        loads_arr[:len(loads)] = np.fromiter((float(v) for v in loads.values()), dtype=np.float64, count=len(loads))
+        deg_arr = np.fromiter((degrees.get(n, 0) for n in id_to_name), dtype=np.int32, count=len(id_to_name))
+        return cls(tuple(id_to_name), name_to_id, loads_arr, deg_arr, nk_idx)
+
+    def deg_pow(self, beta):
+        """Return float64 degree^beta per node id (computed once per beta)."""
+        arr = self._deg_pow.get(beta)
+        if arr is None:
+            arr = self._deg_pow[beta] = _pow_beta(self.degrees, beta)
+        return arr
+
+    def with_loads(self, loads):
+        """Return a state over the same index and degrees holding `loads`."""
+        return replace(self, loads=loads, _deg_pow=self._deg_pow)
+
+    def as_dict(self):
+        return dict(zip(self.names, self.loads.tolist()))
+
+
+def proportional_redistribute_sources_full(loads, degrees, sources, neighbors_map, beta=1.0, nk_map=None):
+    """
+    Simultaneously redistribute the full load of each source in `sources`.
+
+    - `loads`: dict of current loads (pre-redistribution), used as the snapshot L_k values.
+    - `degrees`: dict mapping node -> degree used to compute Π (degree^beta).
+    - `sources`: iterable of source node names (Φ).
+    - `neighbors_map`: dict mapping node -> list of neighbor node names (not including self).
+    - `beta`: exponent for degree weighting (default 1.0).
+    - `nk_map`: optional precomputed neighbourhoods from `precompute_nk(neighbors_map)`.
+
+    `loads` may also be a `SwitchState`; the state's own degrees and Nk are then used
+    (`degrees`, `neighbors_map` and `nk_map` are ignored) and a new `SwitchState` is returned.
+
+    Returns a new loads dict after redistribution. This is a dict wrapper around
+    `redistribute_sources_arrays` (or the compiled `redistribute_csr` when `_redistribute`
+    is built): inputs are converted to arrays once and the result is turned back into a
+    dict at the end.
+    """
+    if isinstance(loads, SwitchState):
+        state = loads
+        source_ids = np.fromiter((state.name_to_id[k] for k in sources if k in state.name_to_id), dtype=np.intp)
+        return state.with_loads(_redistribute(state.loads, state.deg_pow(beta), source_ids, state.nk_idx))
+
+    name_to_id, id_to_name, nk_idx = build_index(loads, neighbors_map, nk_map)
+
+    loads_arr = np.zeros(len(id_to_name), dtype=np.float64)
+    loads_arr[:len(loads)] = np.fromiter((float(v) for v in loads.values()), dtype=np.float64, count=len(loads))
+    deg_pow_arr = degree_powers_array(degrees, id_to_name, beta)
+    source_ids = np.fromiter((name_to_id[k] for k in sources if k in loads), dtype=np.intp)
+
+    new_arr = _redistribute(loads_arr, deg_pow_arr, source_ids, nk_idx)
+
+    new_loads = dict(zip(id_to_name[:len(loads)], new_arr[:len(loads)].tolist()))
+    # nodes outside `loads` only show up if some redistributing source reached them
+    for k in source_ids:
+        if loads_arr[k] > 0.0:
+            for j in nk_idx[k]:
+                if j >= len(loads):
+                    new_loads[id_to_name[j]] = float(new_arr[j])
 
     return new_loads
 
 
-def proportional_redistribute_sources_per_paper(loads, degrees, sources, neighbors_map, beta=1.0, sw2_threshold=None):
+def proportional_redistribute_sources_per_paper(loads, degrees, sources, neighbors_map, beta=1.0, sw2_threshold=None,
+                                                nk_map=None):
     """
     Redistribution following the paper rules with per-source Nk and Sw2 excess-only.
 
@@ -79,58 +265,71 @@ def proportional_redistribute_sources_per_paper(loads, degrees, sources, neighbo
       - ΔL_jk = amount_k * Π_j for all j in Nk
 
     Redistribution is simultaneous: use L_before snapshot for all Lk and apply all deltas
-    together. Returns new loads dict.
+    together. Returns new loads dict. Pass `nk_map` (from `precompute_nk`) to reuse the
+    neighbourhoods across calls on the same graph.
     """
-    L_before = {k: float(v) for k, v in loads.items()}
+    # new_loads doubles as the L_before snapshot: it is not mutated until all deltas are known
+    new_loads = {k: float(v) for k, v in loads.items()}
+    source_nk = _source_nk(sources, neighbors_map, nk_map)
+    # beta == 0 makes every Π_j = 1/|Nk| regardless of degree, so no weights are needed
+    uniform = beta == 0.0
+    pow_deg = None if uniform else _degree_powers(loads, degrees, source_nk.values(), beta)
     delta_total = {n: 0.0 for n in loads.keys()}
+    # (source, amount_k) for every source whose subtraction changes its load, in visiting order;
+    # amount_k is computed exactly once per source
+    applied = []
 
     for k in sources:
-        if k not in L_before:
+        if k not in new_loads:
             continue
-        Lk = float(L_before.get(k, 0.0))
-        if Lk <= 0.0:
-            continue
-
-        # Nk = k plus its neighbor switches (neighbors_map expected to contain only switch neighbors)
-        neigh = list(neighbors_map.get(k, [])) if neighbors_map is not None else []
-        Nk = list(dict.fromkeys([k] + neigh))
-
-        # compute denominator over Nk
-        denom = 0.0
-        for m in Nk:
-            denom += float(degrees.get(m, 0) ** beta)
+        Lk = new_loads[k]
 
         # determine amount to redistribute for this source
         if k == "Sw2" and sw2_threshold is not None:
             amount_k = max(0.0, Lk - float(sw2_threshold))
         else:
             amount_k = Lk
+        # a zero amount is a no-op; a negative Lk is still subtracted (the source ends at 0)
+        if amount_k != 0.0:
+            applied.append((k, amount_k))
+
+        if Lk <= 0.0 or amount_k <= 0.0:
+            continue
+
+        # Nk = k plus its neighbor switches (neighbors_map expected to contain only switch neighbors)
+        Nk = source_nk[k]
 
-        if amount_k <= 0.0:
+        # neighbours outside `loads` start from zero once, so the loops below can use +=
+        for j in Nk:
+            if j not in delta_total:
+                delta_total[j] = 0.0
+                new_loads[j] = 0.0
+
+        if uniform:
+            share = amount_k * (1.0 / len(Nk))
+            for j in Nk:
+                delta_total[j] += share
             continue
 
+        # compute denominator over Nk
+        denom = 0.0
+        for m in Nk:
+            denom += pow_deg[m]
+
         if denom <= 0.0:
             for j in Nk:
-                delta_total[j] = delta_total.get(j, 0.0) + amount_k / len(Nk)
+                delta_total[j] += amount_k / len(Nk)
         else:
             for j in Nk:
-                w = float(degrees.get(j, 0) ** beta) / denom
-                delta_total[j] = delta_total.get(j, 0.0) + amount_k * w
+                w = pow_deg[j] / denom
+                delta_total[j] += amount_k * w
 
     # apply deltas: subtract amount_k from each source (only the redistributed amount)
-    new_loads = {n: float(v) for n, v in L_before.items()}
-    for k in sources:
-        if k not in L_before:
-            continue
-        Lk = float(L_before.get(k, 0.0))
-        if k == "Sw2" and sw2_threshold is not None:
-            amount_k = max(0.0, Lk - float(sw2_threshold))
-        else:
-            amount_k = Lk
-        new_loads[k] = new_loads.get(k, 0.0) - float(amount_k)
+    for k, a in applied:
+        new_loads[k] -= a
 
     for j, d in delta_total.items():
-        new_loads[j] = new_loads.get(j, 0.0) + float(d)
+        new_loads[j] += d
 
     return new_loads
 
@@ -8,10 +8,48 @@ Four schemes:
 
 Selection picks top_k=3 vulnerable switches (excluding the overloaded switch) per scheme metric.
 """
-from copy import deepcopy
+import numpy as np
 
 
 class MitigationScheme:
+    __slots__ = (
+        "scheme_id",
+        "initial_threshold",
+        "s",
+        "top_k",
+        "_trigger_count",
+        "id_to_name",
+        "_name_to_id",
+        "_phi_table",
+        "_phi_rows",
+    )
+
+    # Predefined Φ sets per scheme and redistribution index (1-based)
+    # These come directly from Tables 3-6 in the paper as requested.
+    # Each entry is a tuple of source node names (strings); shared by all instances, never mutated.
+    predefined_phi = {
+        1: (
+            ("Sw1", "Sw2", "Sw3"),
+            ("Sw2", "Sw3", "Sw5"),
+            ("Sw2", "Sw3", "Sw4"),
+        ),
+        2: (
+            ("Sw2", "Sw1", "Sw5"),
+            ("Sw2", "Sw3", "Sw5"),
+            ("Sw2", "Sw3", "Sw4"),
+        ),
+        3: (
+            ("Sw1", "Sw2", "Sw3"),
+            ("Sw2", "Sw3", "Sw5"),
+            ("Sw2", "Sw3", "Sw4"),
+        ),
+        4: (
+            ("Sw2", "Sw1", "Sw5"),
+            ("Sw2", "Sw3", "Sw5"),
+            ("Sw2", "Sw3", "Sw4"),
+        ),
+    }
+
     def __init__(self, scheme_id, initial_threshold=50.0, s=5.0, top_k=3):
         if scheme_id not in (1, 2, 3, 4):
             raise ValueError("scheme_id must be 1..4")
@@ -19,46 +57,87 @@ class MitigationScheme:
         self.initial_threshold = float(initial_threshold)
         self.s = float(s)
         self.top_k = int(top_k)
-        self.dynamic_threshold = float(initial_threshold)
-        # Predefined Φ sets per scheme and redistribution index (1-based)
-        # These come directly from Tables 3-6 in the paper as requested.
-        # Each entry is a list of source node names (strings).
-        self.predefined_phi = {
-            1: [
-                ["Sw1", "Sw2", "Sw3"],
-                ["Sw2", "Sw3", "Sw5"],
-                ["Sw2", "Sw3", "Sw4"],
-            ],
-            2: [
-                ["Sw2", "Sw1", "Sw5"],
-                ["Sw2", "Sw3", "Sw5"],
-                ["Sw2", "Sw3", "Sw4"],
-            ],
-            3: [
-                ["Sw1", "Sw2", "Sw3"],
-                ["Sw2", "Sw3", "Sw5"],
-                ["Sw2", "Sw3", "Sw4"],
-            ],
-            4: [
-                ["Sw2", "Sw1", "Sw5"],
-                ["Sw2", "Sw3", "Sw5"],
-                ["Sw2", "Sw3", "Sw4"],
-            ],
-        }
+        # number of triggers so far; the dynamic threshold is a pure function of it
+        self._trigger_count = 0
+        # Integer form of predefined_phi, built by set_switch_index() (or on first use)
+        self.id_to_name = None
+        self._name_to_id = None
+        self._phi_table = None
+        self._phi_rows = None
+
+    def set_switch_index(self, name_to_id):
+        """
+        Register the switch ids used by the caller and compile `predefined_phi` against them.
+
+        `_phi_table[scheme_id-1, redis_index-1]` holds the Φ row as switch ids (np.int16), padded
+        with -1; switches missing from `name_to_id` are stored as -1 as well.
+        """
+        self._name_to_id = dict(name_to_id)
+        self.id_to_name = [None] * (max(self._name_to_id.values(), default=-1) + 1)
+        for name, i in self._name_to_id.items():
+            self.id_to_name[i] = name
+
+        max_redis = max(len(rows) for rows in self.predefined_phi.values())
+        width = max([self.top_k] + [len(row) for rows in self.predefined_phi.values() for row in rows])
+        self._phi_table = np.full((4, max_redis, width), -1, dtype=np.int16)
+        for sid, rows in self.predefined_phi.items():
+            for r, row in enumerate(rows):
+                for c, name in enumerate(row):
+                    self._phi_table[sid - 1, r, c] = self._name_to_id.get(name, -1)
+        self._phi_rows = {sid: len(rows) for sid, rows in self.predefined_phi.items()}
+
+    def select_source_ids(self, overloaded_id, redis_index=1):
+        """Return the predefined Φ for `redis_index` as an array of switch ids (see `set_switch_index`)."""
+        # redis_index is 1-based; if out of range, fall back to last pattern
+        idx = min(max(int(redis_index) - 1, 0), self._phi_rows[self.scheme_id] - 1)
+        row = self._phi_table[self.scheme_id - 1, idx]
+        return row[(row >= 0) & (row != overloaded_id)]
+
+    def _predefined_sources(self, overloaded_switch, all_switches, redis_index):
+        """
+        Return the predefined Φ for `redis_index` as switch names: the pattern without the overloaded
+        switch, filtered to `all_switches` and cut to `top_k`.
+
+        Switch ids come from `set_switch_index`; without it, `all_switches` is registered on first use.
+        """
+        if self._phi_table is None:
+            self.set_switch_index({s: i for i, s in enumerate(all_switches)})
+        ids = self.select_source_ids(self._name_to_id.get(overloaded_switch, -1), redis_index)
+        # filter to available switches (defensive)
+        sw_set = frozenset(all_switches)
+        return [s for s in map(self.id_to_name.__getitem__, ids.tolist()) if s in sw_set][: self.top_k]
 
     def reset(self):
-        self.dynamic_threshold = float(self.initial_threshold)
+        self._trigger_count = 0
 
     def threshold(self):
-        return float(self.dynamic_threshold)
+        if self.is_dynamic():
+            return max(0.0, self.initial_threshold - self.s * self._trigger_count)
+        return self.initial_threshold
+
+    @property
+    def dynamic_threshold(self):
+        return self.threshold()
 
     def is_dynamic(self):
         return self.scheme_id in (3, 4)
 
     def apply_after_trigger(self):
-        # If dynamic, reduce threshold by s after a trigger
-        if self.is_dynamic():
-            self.dynamic_threshold = max(0.0, self.dynamic_threshold - self.s)
+        # If dynamic, the threshold drops by s for every trigger (see threshold())
+        self._trigger_count += 1
+
+    def select_all_sources(self, loads, reliabilities, overloaded_switch, all_switches):
+        """
+        Return the Φ of every redistribution index at once (`list[list[str]]`, index 1 first).
+
+        Predefined patterns are read from the id table (see `_predefined_sources`). Schemes without
+        predefined patterns return the single metric-based selection.
+        """
+        if self.scheme_id not in self.predefined_phi:
+            return [self.select_sources(loads, reliabilities, overloaded_switch, all_switches)]
+
+        n_patterns = len(self.predefined_phi[self.scheme_id])
+        return [self._predefined_sources(overloaded_switch, all_switches, r) for r in range(1, n_patterns + 1)]
 
     def select_sources(self, loads, reliabilities, overloaded_switch, all_switches, redis_index=1):
         """
@@ -70,17 +149,8 @@ class MitigationScheme:
         Returns a list of source node names (length up to `top_k`).
         """
         # If a predefined Φ exists for this scheme and redistribution index, return it deterministically
-        phi_list = self.predefined_phi.get(self.scheme_id, None)
-        if phi_list is not None:
-            # redis_index is 1-based; if out of range, fall back to last pattern
-            idx = int(redis_index) - 1
-            if idx < 0:
-                idx = 0
-            if idx >= len(phi_list):
-                idx = len(phi_list) - 1
-            # filter to available switches (defensive) and exclude overloaded switch if present
-            phi = [s for s in phi_list[idx] if s in all_switches and s != overloaded_switch]
-            return phi[: self.top_k]
+        if self.scheme_id in self.predefined_phi:
+            return self._predefined_sources(overloaded_switch, all_switches, redis_index)
 
         # Fallback: original behavior (select by reliability or load)
         candidates = [s for s in all_switches if s != overloaded_switch]
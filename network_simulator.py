@@ -1,21 +1,31 @@
 import sys
+import io
+import heapq
 import json
+from contextlib import contextmanager
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QPushButton, QLabel, QSpinBox, QComboBox, QMessageBox, QGraphicsView,
+                             QPushButton, QLabel, QSpinBox, QDoubleSpinBox, QComboBox, QMessageBox, QGraphicsView,
                              QGraphicsScene, QGraphicsItem, QGraphicsEllipseItem, QGraphicsRectItem,
-                             QGraphicsLineItem, QGraphicsTextItem, QGraphicsPathItem, QGraphicsPolygonItem,
-                             QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QDialog, QDockWidget)
-from PyQt6.QtCore import Qt, QPointF, QRectF, QTimer, pyqtSignal, QObject, QLineF, QEvent
-from PyQt6.QtGui import QColor, QPen, QBrush, QFont, QPainter, QPalette, QPolygonF, QDrag, QPixmap
+                             QGraphicsLineItem, QGraphicsTextItem, QGraphicsSimpleTextItem, QGraphicsPathItem, QGraphicsPolygonItem,
+                             QTabWidget, QTableWidget, QTableWidgetItem, QTableView, QHeaderView, QSplitter, QDialog, QDockWidget)
+from PyQt6.QtCore import (Qt, QPointF, QRectF, QTimer, pyqtSignal, pyqtSlot, QObject, QThread, QLineF, QEvent,
+                          QAbstractTableModel, QModelIndex)
+from PyQt6.QtGui import QColor, QPen, QBrush, QFont, QPainter, QPainterPath, QPalette, QPolygonF, QDrag, QPixmap
 from PyQt6.QtCore import Qt as QtCore
 import math
 import random
-from aftm_model import reliability_R
-from load_redistribution import proportional_redistribute_sources_full
-import matplotlib.pyplot as plt
+import numpy as np
+from load_redistribution import SwitchState, build_nk_csr, precompute_nk, proportional_redistribute_sources_full
+import sim_kernel
+from matplotlib.figure import Figure
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ==================== ENUMS & DATA CLASSES ====================
@@ -26,6 +36,11 @@ class ComponentType(Enum):
     SAN = "Storage Area Network"
 
 
+# Integer code of each component type, as stored in ComponentTable.type_code
+TYPE_CODES = {t: code for code, t in enumerate(ComponentType)}
+SWITCH_CODE = TYPE_CODES[ComponentType.SWITCH]
+
+
 class LoadDistributionStrategy(Enum):
     """Load distribution strategies for threshold-based redistribution."""
     NONE = "None"
@@ -37,7 +52,7 @@ class LoadDistributionStrategy(Enum):
     LATENCY_AWARE = "Latency-Aware Redistribution"
 
 
-@dataclass
+@dataclass(slots=True)
 class TrafficData:
     """Represents traffic flow between components."""
     source_id: str
@@ -48,7 +63,7 @@ class TrafficData:
     packet_loss: float = 0.0  # Percentage
     
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionStats:
     """Statistics for a connection."""
     total_packets: int = 0
@@ -106,13 +121,256 @@ class RedistributionDialog(QDialog):
         self.setLayout(layout)
 
 
+class GraphDialog(QDialog):
+    """Non-modal window showing a rendered graph image."""
+    
+    def __init__(self, parent=None, title="Graph", pixmap=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        layout = QVBoxLayout()
+        image = QLabel()
+        if pixmap is not None:
+            image.setPixmap(pixmap)
+        layout.addWidget(image)
+        self.setLayout(layout)
+
+
+# ==================== WORKERS ====================
+class PlotWorker(QObject):
+    """Renders a history graph to PNG bytes on a worker thread.
+    
+    Uses `matplotlib.figure.Figure` directly (no pyplot state), so it is safe off the UI thread.
+    `series` is a list of (label, color, times, values) snapshots taken by the caller.
+    """
+    finished = pyqtSignal(bytes, str)  # PNG bytes, title
+    
+    def __init__(self, series, y_label: str, title: str):
+        super().__init__()
+        self.series = series
+        self.y_label = y_label
+        self.title = title
+    
+    @pyqtSlot()
+    def run(self):
+        fig = Figure(figsize=(12, 6))
+        ax = fig.add_subplot()
+        for label, color, times, values in self.series:
+            ax.plot(times, values, marker='o', label=label, color=color, linewidth=2)
+        ax.set_xlabel('Time (steps)', fontsize=12)
+        ax.set_ylabel(self.y_label, fontsize=12)
+        ax.set_title(self.title, fontsize=14, fontweight='bold')
+        ax.legend(loc='best')
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png')
+        self.finished.emit(buf.getvalue(), self.title)
+
+
 # ==================== NETWORK COMPONENTS ====================
+class ComponentTable:
+    """Structure-of-arrays storage for the numeric state of network components.
+    
+    Every component owns one row; each field is a contiguous NumPy column so per-tick load
+    and reliability updates run as vectorized array ops instead of per-object Python loops.
+    """
+    
+    COLUMNS = {
+        'current_load': np.float64,
+        'bandwidth_capacity': np.float64,
+        'incoming_requests': np.float64,
+        'cumulative_request_load': np.float64,
+        'reliability': np.float64,
+        'operational_time': np.float64,
+        'base_lambda': np.float64,
+        'alpha': np.float64,
+        'active': np.bool_,
+        'load_pct': np.float64,  # current_load / bandwidth_capacity * 100, kept in sync on writes
+        'type_code': np.int8,  # TYPE_CODES[component.type], set once at construction
+        'power_consumption': np.float64,  # switches only (energy-aware fields)
+        'sleep_mode': np.bool_,
+    }
+    
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        # rows released by removed components, handed out again before the table grows
+        self.free_rows: List[int] = []
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+    
+    def allocate(self) -> int:
+        """Reserve a row for a new component (released rows first; columns double in size when full)."""
+        if self.free_rows:
+            return self.free_rows.pop()
+        capacity = len(self.current_load)
+        if self.size == capacity:
+            for name in self.COLUMNS:
+                old = getattr(self, name)
+                new = np.zeros(capacity * 2, dtype=old.dtype)
+                new[:capacity] = old
+                setattr(self, name, new)
+        row = self.size
+        self.size += 1
+        return row
+    
+    def release(self, rows: List[int]):
+        """Zero the rows of components that were removed and make them available to `allocate`."""
+        for name in self.COLUMNS:
+            getattr(self, name)[rows] = 0
+        self.free_rows.extend(rows)
+        # lowest rows are handed out first
+        self.free_rows.sort(reverse=True)
+    
+    def load_percentage(self, rows: np.ndarray) -> np.ndarray:
+        """Vectorized `NetworkComponent.get_load_percentage` for the given rows."""
+        loads = self.current_load[rows]
+        caps = self.bandwidth_capacity[rows]
+        pct = np.zeros_like(loads)
+        np.divide(loads, caps, out=pct, where=caps > 0)
+        return pct * 100
+    
+    def update_load_pct(self, rows):
+        """Refresh the cached `load_pct` after `current_load` or `bandwidth_capacity` changed."""
+        if np.ndim(rows) == 0:
+            cap = self.bandwidth_capacity[rows]
+            self.load_pct[rows] = (self.current_load[rows] / cap) * 100 if cap > 0 else 0.0
+        else:
+            self.load_pct[rows] = self.load_percentage(rows)
+    
+    def update_power(self, rows: np.ndarray):
+        """Vectorized `SwitchComponent.calculate_power_consumption` for the given switch rows."""
+        awake = rows[self.active[rows] & ~self.sleep_mode[rows]]
+        self.power_consumption[awake] = 50.0 + (self.current_load[awake] / 100.0) * 150.0
+
+
+class TableField:
+    """Descriptor that stores a NetworkComponent attribute in its ComponentTable column."""
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj._table, self.name)[obj._row].item()
+    
+    def __set__(self, obj, value):
+        getattr(obj._table, self.name)[obj._row] = value
+
+
+class LoadField(TableField):
+    """TableField whose writes also refresh the row's cached load percentage."""
+    
+    def __set__(self, obj, value):
+        super().__set__(obj, value)
+        obj._table.update_load_pct(obj._row)
+
+
+@dataclass
+class SwitchTopology:
+    """Switch-side view of the graph, rebuilt only when components or connections change.
+    
+    The switch -> neighbor adjacency is kept in CSR form: `indices[indptr[i]:indptr[i+1]]` are the
+    table rows of switch i's neighbors and `weights` their base-load contribution.
+    """
+    switches: List['NetworkComponent']
+    rows: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    base_load: np.ndarray  # 20 × servers + 5 × switches + 10 × SANs per switch
+    endpoints: np.ndarray  # connected servers + SANs per switch
+    index: Dict[str, int]  # switch id -> position in `switches`
+    neighbors_map: Dict[str, List[str]]  # switch id -> ids of connected switches (shared, do not mutate)
+    degrees: Dict[str, int]  # switch id -> number of connected switches
+    nk_map: Dict[str, tuple]  # switch id -> N_k for proportional redistribution (see precompute_nk)
+    any_can_redistribute: bool  # some switch has a switch neighbor
+    state: SwitchState  # redistribution index over `switches` (node id == position), loads unset
+    eligible: np.ndarray  # positions of the switches with a switch neighbor
+    nk_offsets: np.ndarray  # N_k of every switch in CSR form over positions (see build_nk_csr)
+    nk_indices: np.ndarray
+    # Scratch buffers aligned with `switches`, reused by every tick of this topology
+    loads_buf: np.ndarray
+    over_buf: np.ndarray
+
+
+# Base load a switch receives from each connected component type
+BASE_LOAD_WEIGHTS = {
+    ComponentType.SERVER: 20,
+    ComponentType.SWITCH: 5,
+    ComponentType.SAN: 10,
+}
+# BASE_LOAD_WEIGHTS and the "endpoint" (server or SAN) flag, indexed by type code
+BASE_LOAD_BY_CODE = np.array([BASE_LOAD_WEIGHTS[t] for t in ComponentType], dtype=np.float64)
+ENDPOINT_BY_CODE = np.array([t in (ComponentType.SERVER, ComponentType.SAN) for t in ComponentType], dtype=np.float64)
+
+
+def top_k_order(keys: np.ndarray, k: int) -> np.ndarray:
+    """Return the indices of the `k` smallest `keys`, smallest first.
+    
+    Matches `sorted(range(n), key=keys.__getitem__)[:k]` (equal keys keep their input order) but
+    partitions in O(n) and only sorts the selected `k`.
+    """
+    if k >= len(keys):
+        return np.argsort(keys, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    kth = np.partition(keys, k - 1)[k - 1]
+    better = np.flatnonzero(keys < kth)
+    ties = np.flatnonzero(keys == kth)[:k - len(better)]
+    sel = np.concatenate((better, ties))
+    return sel[np.argsort(keys[sel], kind='stable')]
+
+
 class NetworkComponent:
-    """Base class for network components."""
+    """Base class for network components.
+    
+    Numeric state lives in the shared ComponentTable (see the field descriptors below); the
+    remaining per-instance attributes are slots. Type-specific fields are on the subclasses,
+    use `NetworkComponent.create` to build the right one for a ComponentType.
+    """
+    
+    __slots__ = (
+        '_table',
+        '_row',
+        'id',
+        'type',
+        'x',
+        'y',
+        'width',
+        'height',
+        'connections',
+        'over_threshold',
+        'connection_stats',
+    )
     
     _id_counter = {}
+    # Shared numeric state of all components, one row each (see ComponentTable)
+    table = ComponentTable()
+    
+    current_load = LoadField()
+    bandwidth_capacity = LoadField()
+    incoming_requests = TableField()
+    cumulative_request_load = TableField()
+    reliability = TableField()
+    operational_time = TableField()
+    base_lambda = TableField()
+    alpha = TableField()
+    active = TableField()
+    
+    # Latency jitter factors for simulate_traffic, drawn from NumPy in batches
+    JITTER_BATCH = 4096
+    _rng = np.random.default_rng()
+    _jitter: List[float] = []
+    _jitter_pos = 0
     
     def __init__(self, component_type: ComponentType, x: float = 0, y: float = 0):
+        self._table = NetworkComponent.table
+        self._row = self._table.allocate()
+        
         # Generate unique ID
         if component_type not in NetworkComponent._id_counter:
             NetworkComponent._id_counter[component_type] = 0
@@ -120,6 +378,7 @@ class NetworkComponent:
         
         self.id = f"{component_type.value.replace(' ', '_')}_{NetworkComponent._id_counter[component_type]}"
         self.type = component_type
+        self._table.type_code[self._row] = TYPE_CODES[component_type]
         self.x = x
         self.y = y
         self.width = 80
@@ -138,14 +397,12 @@ class NetworkComponent:
         self.alpha = 1.0  # Load exponent
         self.active = True
         self.over_threshold = False  # Flag for switches that stay over threshold
-        self.cpu_usage = 0.0  # For servers
-        self.memory_usage = 0.0  # For servers
-        self.storage_available = 1000  # GB for SAN
-        self.storage_used = 0.0  # GB
         self.connection_stats: Dict[str, ConnectionStats] = {}
-        # Energy-aware fields
-        self.power_consumption = 0.0  # Watts
-        self.sleep_mode = False  # Can be put to sleep if load < 10
+    
+    @staticmethod
+    def create(component_type: ComponentType, x: float = 0, y: float = 0) -> 'NetworkComponent':
+        """Create a component of the subclass matching `component_type`."""
+        return COMPONENT_CLASSES[component_type](x, y)
     
     def connect_to(self, target_id: str):
         """Create connection to another component."""
@@ -158,30 +415,34 @@ class NetworkComponent:
             self.connections.remove(target_id)
     
     def get_load_percentage(self) -> float:
-        """Get current load as percentage of capacity."""
-        return (self.current_load / self.bandwidth_capacity) * 100 if self.bandwidth_capacity > 0 else 0
+        """Get current load as percentage of capacity (cached in the component table)."""
+        return self._table.load_pct[self._row].item()
     
-    def calculate_power_consumption(self) -> float:
-        """Calculate power consumption based on load.
+    @classmethod
+    def next_jitter(cls) -> float:
+        """Return the next latency jitter factor, uniform in [0.5, 2.0)."""
+        if cls._jitter_pos == len(cls._jitter):
+            cls._jitter = cls._rng.uniform(0.5, 2.0, size=cls.JITTER_BATCH).tolist()
+            cls._jitter_pos = 0
+        jitter = cls._jitter[cls._jitter_pos]
+        cls._jitter_pos += 1
+        return jitter
+    
+    def simulate_traffic(self, traffic: TrafficData, jitter: Optional[float] = None):
+        """Process incoming traffic.
         
-        Formula: power = 50W (base) + (load / 100) * 150W (load-proportional)
-        If sleep_mode: power = 0W (but unavailable)
+        `jitter` scales the added latency; callers processing many components per tick can pass
+        entries of one `uniform(0.5, 2.0, size=n)` draw, otherwise `next_jitter()` is used.
         """
-        if self.sleep_mode or not self.active:
-            return 0.0
-        # Base 50W + up to 150W proportional to load
-        self.power_consumption = 50.0 + (self.current_load / 100.0) * 150.0
-        return self.power_consumption
-    
-    def simulate_traffic(self, traffic: TrafficData):
-        """Process incoming traffic."""
         if not self.active:
             traffic.packet_loss = 100
             return
         
         # Add latency based on load
         load_percentage = self.get_load_percentage()
-        traffic.latency_ms += (1 + load_percentage / 100) * random.uniform(0.5, 2.0)
+        if jitter is None:
+            jitter = self.next_jitter()
+        traffic.latency_ms += (1 + load_percentage / 100) * jitter
         
         # Calculate packet loss based on load
         if load_percentage > 90:
@@ -207,19 +468,240 @@ class NetworkComponent:
             'y': self.y,
             'connections': self.connections,
             'bandwidth_capacity': self.bandwidth_capacity,
-            'cpu_usage': self.cpu_usage,
-            'memory_usage': self.memory_usage,
-            'storage_available': self.storage_available,
             'incoming_requests': self.incoming_requests,
             'cumulative_request_load': self.cumulative_request_load,
             'operational_time': self.operational_time,
             'base_lambda': self.base_lambda,
             'alpha': self.alpha,
         }
+
+
+class ServerComponent(NetworkComponent):
+    """Server: tracks CPU and memory usage."""
+    
+    __slots__ = ('cpu_usage', 'memory_usage')
+    
+    def __init__(self, x: float = 0, y: float = 0):
+        super().__init__(ComponentType.SERVER, x, y)
+        self.cpu_usage = 0.0
+        self.memory_usage = 0.0
+    
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data['cpu_usage'] = self.cpu_usage
+        data['memory_usage'] = self.memory_usage
+        return data
+
+
+class SwitchComponent(NetworkComponent):
+    """Switch: carries the redistributed load and the energy-aware fields."""
+    
+    __slots__ = ()
+    
+    power_consumption = TableField()
+    sleep_mode = TableField()
+    
+    def __init__(self, x: float = 0, y: float = 0):
+        super().__init__(ComponentType.SWITCH, x, y)
+        # Energy-aware fields
+        self.power_consumption = 0.0  # Watts
+        self.sleep_mode = False  # Can be put to sleep if load < 10
+    
+    def calculate_power_consumption(self) -> float:
+        """Calculate power consumption based on load.
+        
+        Formula: power = 50W (base) + (load / 100) * 150W (load-proportional)
+        If sleep_mode: power = 0W (but unavailable)
+        """
+        if self.sleep_mode or not self.active:
+            return 0.0
+        # Base 50W + up to 150W proportional to load
+        self.power_consumption = 50.0 + (self.current_load / 100.0) * 150.0
+        return self.power_consumption
+
+
+class SANComponent(NetworkComponent):
+    """Storage area network: tracks storage capacity."""
+    
+    __slots__ = ('storage_available', 'storage_used')
+    
+    def __init__(self, x: float = 0, y: float = 0):
+        super().__init__(ComponentType.SAN, x, y)
+        self.storage_available = 1000  # GB
+        self.storage_used = 0.0  # GB
+    
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data['storage_available'] = self.storage_available
+        return data
+
+
+COMPONENT_CLASSES = {
+    ComponentType.SERVER: ServerComponent,
+    ComponentType.SWITCH: SwitchComponent,
+    ComponentType.SAN: SANComponent,
+}
+
+
+class HistoryBuffer:
+    """Ring buffer of (timestamp, value) samples for one switch.
+    
+    Samples live in two NumPy arrays (uint32 steps, float32 values) that grow by doubling up to
+    `capacity`; past that the oldest samples are overwritten. Appends allocate no Python objects.
+    The history only feeds the plots, so values are kept in single precision.
+    """
+    
+    # 24 hours of samples logged every 5 seconds
+    DEFAULT_CAPACITY = 17280
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        size = min(256, capacity)
+        self.times = np.empty(size, dtype=np.uint32)
+        self.values = np.empty(size, dtype=np.float32)
+        self.head = 0  # total samples appended so far
+    
+    def __len__(self) -> int:
+        return min(self.head, self.capacity)
+    
+    def append(self, timestamp, value):
+        size = len(self.times)
+        if self.head == size and size < self.capacity:
+            new_size = min(size * 2, self.capacity)
+            self.times = np.resize(self.times, new_size)
+            self.values = np.resize(self.values, new_size)
+            size = new_size
+        i = self.head % size
+        self.times[i] = timestamp
+        self.values[i] = value
+        self.head += 1
+    
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return copies of (times, values), oldest sample first."""
+        if self.head <= self.capacity:
+            return self.times[:self.head].copy(), self.values[:self.head].copy()
+        start = self.head % self.capacity
+        return np.roll(self.times, -start), np.roll(self.values, -start)
+
+
 # ==================== GRAPHICS COMPONENTS ====================
+class SwitchStatsModel(QAbstractTableModel):
+    """Switch statistics table backed by NumPy snapshots of the switch columns.
+    
+    `refresh()` copies the values of all switches in one pass and emits a single `dataChanged`;
+    cells are only formatted when the view paints them. Req/s, Lambda and Alpha are editable:
+    accepted edits are written to the switch and reported through `edited`.
+    """
+    
+    HEADERS = ["Switch", "Load", "Power (W)", "Req/s", "Reliability", "Lambda", "Alpha", "Op.Time"]
+    # editable column -> switch attribute
+    EDITABLE = {3: 'incoming_requests', 5: 'base_lambda', 6: 'alpha'}
+    
+    edited = pyqtSignal(object)  # the switch whose parameters were changed
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.switches: List['NetworkComponent'] = []
+        self.columns = np.zeros((len(self.HEADERS), 0), dtype=np.float64)  # column 0 unused
+    
+    def refresh(self, switches: List['NetworkComponent']):
+        """Snapshot the stats of `switches`; resets the model only when the switch list changed."""
+        table = NetworkComponent.table
+        rows = np.fromiter((s._row for s in switches), dtype=np.intp, count=len(switches))
+        columns = np.empty((len(self.HEADERS), len(switches)), dtype=np.float64)
+        columns[1] = table.current_load[rows]
+        columns[2] = table.power_consumption[rows]
+        columns[3] = table.incoming_requests[rows]
+        columns[4] = table.reliability[rows]
+        columns[5] = table.base_lambda[rows]
+        columns[6] = table.alpha[rows]
+        columns[7] = table.operational_time[rows]
+        
+        if len(switches) != len(self.switches) or any(a is not b for a, b in zip(switches, self.switches)):
+            self.beginResetModel()
+            self.switches = list(switches)
+            self.columns = columns
+            self.endResetModel()
+        elif switches:
+            self.columns = columns
+            self.dataChanged.emit(self.index(0, 1), self.index(len(switches) - 1, len(self.HEADERS) - 1))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.switches)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            return self.switches[row].id
+        value = float(self.columns[column, row])
+        if column == 3:
+            return str(int(value))
+        if column == 4:
+            return f"{value:.4f}"  # AFTM-based reliability
+        if column == 5:
+            return f"{value:.2e}"
+        if column == 6:
+            return str(value)
+        if column == 7:
+            return f"{value:.1f}s"
+        return f"{value:.1f}"  # Load, Power (energy-aware feature)
+    
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() in self.EDITABLE:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or index.column() not in self.EDITABLE:
+            return False
+        try:
+            val = max(0.0, float(value))
+        except (TypeError, ValueError):
+            return False
+        switch = self.switches[index.row()]
+        name = self.EDITABLE[index.column()]
+        if getattr(switch, name) == val:
+            # committing an unchanged cell (e.g. tabbing through the editor) needs no recalculation
+            return True
+        setattr(switch, name, val)
+        self.columns[index.column(), index.row()] = val
+        self.dataChanged.emit(index, index)
+        self.edited.emit(switch)
+        return True
+
+
 class GraphicsNetworkComponent(QGraphicsItem):
     """Graphics representation of a network component."""
     
+    # Shared paint resources: base fill per type, and the load/threshold colors overriding it
+    TYPE_BRUSHES = {
+        ComponentType.SERVER: QBrush(QColor(52, 152, 219)),  # Blue
+        ComponentType.SWITCH: QBrush(QColor(46, 204, 113)),  # Green
+        ComponentType.SAN: QBrush(QColor(155, 89, 182)),  # Purple
+    }
+    # Indexed by load bucket (see load_bucket); bucket 0 keeps the type color
+    LOAD_BRUSHES = [
+        None,
+        QBrush(QColor(241, 196, 15)),  # Yellow for medium load
+        QBrush(QColor(231, 76, 60)),  # Red for high load
+        QBrush(QColor(192, 57, 43)),  # Dark red for persistent over-threshold
+    ]
+    OUTLINE_PEN = QPen(QColor(0, 0, 0), 2)
+    SELECTION_PEN = QPen(QColor(255, 0, 0), 3, Qt.PenStyle.DashLine)
+    LABEL_PEN = QPen(QColor(255, 255, 255), 1)
+    LABEL_FONT = None  # created on first paint (needs a running QApplication)
+    
     def __init__(self, component: NetworkComponent):
         super().__init__()
         self.component = component
@@ -230,35 +712,47 @@ class GraphicsNetworkComponent(QGraphicsItem):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
         self.is_hovering = False
         self.setZValue(1)
+        # Connection lines attached to this item, so a move only touches its own lines
+        self.connection_items: List['GraphicsConnection'] = []
+        # Bucket the item was last painted with; refresh() repaints only when it changes
+        self._last_bucket = -1
+        # Label text is fixed once the item exists
+        self.label_text = component.id
+        if component.type == ComponentType.SWITCH:
+            parts = component.id.split('_')
+            self.label_text = parts[-1] if parts and parts[-1].isdigit() else component.id
     
     def boundingRect(self) -> QRectF:
         return QRectF(-40, -30, 80, 60)
     
+    def load_bucket(self) -> int:
+        """Return 3 if over threshold, else 2 above 80% load, 1 above 50%, 0 otherwise."""
+        if self.component.over_threshold:
+            return 3
+        load_percentage = self.component.get_load_percentage()
+        if load_percentage > 80:
+            return 2
+        if load_percentage > 50:
+            return 1
+        return 0
+    
+    def refresh(self):
+        """Schedule a repaint only if the load color changed since the last paint."""
+        if self.load_bucket() != self._last_bucket:
+            self.update()
+    
     def paint(self, painter: QPainter, option, widget):
         # Draw based on component type
         rect = self.boundingRect()
         
-        # Determine color based on type and load
-        if self.component.type == ComponentType.SERVER:
-            base_color = QColor(52, 152, 219)  # Blue
-        elif self.component.type == ComponentType.SWITCH:
-            base_color = QColor(46, 204, 113)  # Green
-        else:  # SAN
-            base_color = QColor(155, 89, 182)  # Purple
-        
-        # Adjust color based on load or over_threshold status
-        if self.component.over_threshold:
-            base_color = QColor(192, 57, 43)  # Dark red for persistent over-threshold
-        else:
-            load_percentage = self.component.get_load_percentage()
-            if load_percentage > 80:
-                base_color = QColor(231, 76, 60)  # Red for high load
-            elif load_percentage > 50:
-                base_color = QColor(241, 196, 15)  # Yellow for medium load
+        # Color based on type, overridden by load or over_threshold status
+        bucket = self.load_bucket()
+        self._last_bucket = bucket
+        brush = self.LOAD_BRUSHES[bucket] or self.TYPE_BRUSHES[self.component.type]
         
         # Draw main shape
-        painter.setBrush(QBrush(base_color))
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
+        painter.setBrush(brush)
+        painter.setPen(self.OUTLINE_PEN)
         
         if self.component.type == ComponentType.SERVER:
             painter.drawRect(rect)
@@ -269,23 +763,23 @@ class GraphicsNetworkComponent(QGraphicsItem):
         
         # Draw selection indicator
         if self.isSelected():
-            painter.setPen(QPen(QColor(255, 0, 0), 3, Qt.PenStyle.DashLine))
+            painter.setPen(self.SELECTION_PEN)
             painter.drawRect(rect)
         
         # Draw component ID
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
-        font = QFont("Arial", 8, QFont.Weight.Bold)
-        painter.setFont(font)
-        label_text = self.component.id
-        if self.component.type == ComponentType.SWITCH:
-            parts = self.component.id.split('_')
-            label_text = parts[-1] if parts and parts[-1].isdigit() else self.component.id
-        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label_text)
+        if GraphicsNetworkComponent.LABEL_FONT is None:
+            GraphicsNetworkComponent.LABEL_FONT = QFont("Arial", 8, QFont.Weight.Bold)
+        painter.setPen(self.LABEL_PEN)
+        painter.setFont(self.LABEL_FONT)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.label_text)
     
     def itemChange(self, change, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionChange:
             self.component.x = value.x()
             self.component.y = value.y()
+        elif change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
+            for conn in self.connection_items:
+                conn.update_line()
         return super().itemChange(change, value)
     
     def hoverEnterEvent(self, event):
@@ -300,76 +794,132 @@ class GraphicsNetworkComponent(QGraphicsItem):
 class GraphicsConnection(QGraphicsLineItem):
     """Graphics representation of a connection between components."""
     
+    ARROW_SIZE = 10
+    # cos/sin of the arrow-head half angle (pi / 6)
+    ARROW_COS = math.cos(math.pi / 6)
+    ARROW_SIN = math.sin(math.pi / 6)
+    IDLE_PEN = QPen(QColor(100, 100, 100), 2)
+    IDLE_BRUSH = QBrush(QColor(100, 100, 100))
+    # Latency label box and text
+    LABEL_BRUSH = QBrush(QColor(0, 0, 0, 150))
+    LABEL_TEXT_BRUSH = QBrush(QColor(255, 255, 255))
+    # Traffic intensity is quantized to this many levels, each with a shared pen and arrow brush
+    TRAFFIC_LEVELS = 8
+    _traffic_styles: Dict[int, Tuple[QPen, QBrush]] = {}
+    
     def __init__(self, source_item: GraphicsNetworkComponent, dest_item: GraphicsNetworkComponent, latency_factor: float = 0.02):
         super().__init__()
         self.source_item = source_item
         self.dest_item = dest_item
         self.traffic_flow = 0.0
         self.latency_factor = latency_factor
+        # Line geometry and arrow head; recomputed by update_line when an endpoint moves
+        self._line = QLineF()
+        self._arrow = QPolygonF()
+        # The latency label is a pair of child items placed by update_line, so Qt caches its
+        # rendering and paint() only draws the line and arrow
+        self._label_box = QGraphicsPathItem(self)
+        self._label_box.setBrush(self.LABEL_BRUSH)
+        self._label_box.setPen(QPen(Qt.PenStyle.NoPen))
+        self._label = QGraphicsSimpleTextItem(self)
+        self._label.setBrush(self.LABEL_TEXT_BRUSH)
+        for label_item in (self._label_box, self._label):
+            label_item.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        source_item.connection_items.append(self)
+        dest_item.connection_items.append(self)
         self.update_line()
-        self.setPen(QPen(QColor(100, 100, 100), 2))
+        self.setPen(self.IDLE_PEN)
         self.setZValue(0)
     
+    def detach(self):
+        """Unregister this line from its endpoint items."""
+        for item in (self.source_item, self.dest_item):
+            if self in item.connection_items:
+                item.connection_items.remove(self)
+    
     def update_line(self):
-        """Update line position based on item positions."""
+        """Update line position, arrow head and latency label based on item positions."""
         line = QLineF(self.source_item.scenePos(), self.dest_item.scenePos())
         self.setLine(line)
+        self._line = line
+        self._arrow = self.arrow_polygon(line)
+        
+        # Latency label centered on the midpoint (the line item sits at the scene origin)
+        latency_ms = math.hypot(
+            self.source_item.component.x - self.dest_item.component.x,
+            self.source_item.component.y - self.dest_item.component.y
+        ) * self.latency_factor
+        latency_text = f"{latency_ms:.1f} ms"
+        if latency_text != self._label.text():
+            self._label.setText(latency_text)
+        midpoint = line.pointAt(0.5)
+        text_rect = self._label.boundingRect()
+        self._label.setPos(midpoint.x() - text_rect.width() / 2, midpoint.y() - text_rect.height() / 2)
+        box = QPainterPath()
+        box.addRoundedRect(QRectF(midpoint.x() - text_rect.width() / 2 - 2, midpoint.y() - text_rect.height() / 2,
+                                  text_rect.width() + 4, text_rect.height()), 3, 3)
+        self._label_box.setPath(box)
     
-    def paint(self, painter: QPainter, option, widget):
-        # Draw connection line with color based on traffic
-        if self.traffic_flow > 0:
-            # Green to red based on traffic
-            intensity = min(self.traffic_flow / 500, 1.0)
+    @classmethod
+    def traffic_style(cls, traffic_flow: float) -> Tuple[QPen, QBrush]:
+        """Return the shared line pen and arrow brush for `traffic_flow` (green to red, quantized intensity)."""
+        if traffic_flow <= 0:
+            return cls.IDLE_PEN, cls.IDLE_BRUSH
+        level = max(1, round(min(traffic_flow / 500, 1.0) * cls.TRAFFIC_LEVELS))
+        style = cls._traffic_styles.get(level)
+        if style is None:
+            intensity = level / cls.TRAFFIC_LEVELS
             color = QColor(
                 int(255 * intensity),
                 int(200 * (1 - intensity)),
                 int(50 * (1 - intensity))
             )
-            painter.setPen(QPen(color, 2 + intensity * 2))
-        else:
-            painter.setPen(QPen(QColor(100, 100, 100), 2))
-        
-        painter.drawLine(self.line())
+            style = cls._traffic_styles[level] = (QPen(color, 2 + intensity * 2), QBrush(color))
+        return style
+    
+    @classmethod
+    def arrow_polygon(cls, line: QLineF) -> QPolygonF:
+        """Return the arrow head at the end of `line`."""
+        p2 = line.p2()
+        dx, dy = line.dx(), line.dy()
+        length = math.hypot(dx, dy)
+        # unit direction of the line; a zero-length line points along +x (as atan2(0, 0) did)
+        ux, uy = (dx / length, dy / length) if length > 0 else (1.0, 0.0)
+        c = cls.ARROW_SIZE * cls.ARROW_COS
+        sn = cls.ARROW_SIZE * cls.ARROW_SIN
+        # the direction rotated by -pi/6 and +pi/6
+        arrow_p1 = p2 - QPointF(ux * c + uy * sn, uy * c - ux * sn)
+        arrow_p2 = p2 - QPointF(ux * c - uy * sn, uy * c + ux * sn)
+        return QPolygonF([p2, arrow_p1, arrow_p2])
+    
+    def paint(self, painter: QPainter, option, widget):
+        # Draw connection line with color based on traffic
+        pen, brush = self.traffic_style(self.traffic_flow)
+        painter.setPen(pen)
+        painter.drawLine(self._line)
         
         # Draw arrow
-        angle = math.atan2(self.line().dy(), self.line().dx())
-        arrow_size = 10
-        
-        arrow_p1 = self.line().p2() - QPointF(arrow_size * math.cos(angle - math.pi / 6),
-                                               arrow_size * math.sin(angle - math.pi / 6))
-        arrow_p2 = self.line().p2() - QPointF(arrow_size * math.cos(angle + math.pi / 6),
-                                               arrow_size * math.sin(angle + math.pi / 6))
-        
-        painter.setBrush(QBrush(painter.pen().color()))
-        polygon = QPolygonF([self.line().p2(), arrow_p1, arrow_p2])
-        painter.drawPolygon(polygon)
-
-        # Draw latency label at midpoint
-        midpoint = self.line().pointAt(0.5)
-        latency_ms = math.hypot(
-            self.source_item.component.x - self.dest_item.component.x,
-            self.source_item.component.y - self.dest_item.component.y
-        ) * self.latency_factor
-        latency_text = f"{latency_ms:.1f} ms"
-        text_rect_width = painter.fontMetrics().horizontalAdvance(latency_text) + 4
-        text_rect_height = painter.fontMetrics().height()
-        text_rect = QRectF(
-            midpoint.x() - text_rect_width / 2,
-            midpoint.y() - text_rect_height / 2,
-            text_rect_width,
-            text_rect_height
-        )
-        painter.setBrush(QBrush(QColor(0, 0, 0, 150)))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(text_rect, 3, 3)
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, latency_text)
+        painter.setBrush(brush)
+        painter.drawPolygon(self._arrow)
 
 
 # ==================== MAIN APPLICATION ====================
 class NetworkSimulator(QMainWindow):
     """Main application window for network simulation."""
     
+    # Upper bound on the points plotted per switch in generate_graph
+    MAX_PLOT_POINTS = 2000
+    
+    # Redistribution method run by each strategy (NONE runs nothing)
+    REDISTRIBUTION_METHODS = {
+        LoadDistributionStrategy.STATIC_THRESHOLD_RELIABILITY_SENSITIVE: 'apply_static_threshold_redistribution',
+        LoadDistributionStrategy.STATIC_THRESHOLD_LOAD_SENSITIVE: 'apply_static_threshold_load_sensitive_redistribution',
+        LoadDistributionStrategy.DYNAMIC_THRESHOLD_RELIABILITY_SENSITIVE: 'apply_dynamic_threshold_reliability_sensitive_redistribution',
+        LoadDistributionStrategy.DYNAMIC_THRESHOLD_LOAD_SENSITIVE: 'apply_dynamic_threshold_load_sensitive_redistribution',
+        LoadDistributionStrategy.ENERGY_AWARE_OPTIMIZATION: 'apply_energy_aware_redistribution',
+        LoadDistributionStrategy.LATENCY_AWARE: 'apply_latency_aware_redistribution',
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Network Simulator - SAN Environment")
@@ -377,8 +927,15 @@ class NetworkSimulator(QMainWindow):
         
         # Application state
         self.components: Dict[str, NetworkComponent] = {}
+        # Components of each type in `components` order, kept in step by _register_component/clear_all
+        self.components_by_type: Dict[ComponentType, List[NetworkComponent]] = {t: [] for t in ComponentType}
+        self.switches = self.components_by_type[ComponentType.SWITCH]
+        self.servers = self.components_by_type[ComponentType.SERVER]
+        self.sans = self.components_by_type[ComponentType.SAN]
         self.graphics_items: Dict[str, GraphicsNetworkComponent] = {}
         self.connections_graphics: List[GraphicsConnection] = []
+        # Lines per unordered component pair; a pair can carry more than one line (e.g. A->B and B->A)
+        self.edge_index: Dict[frozenset, List[GraphicsConnection]] = {}
         self.simulation_running = False
         self.simulation_paused = False
         self.simulation_time = 0
@@ -392,10 +949,15 @@ class NetworkSimulator(QMainWindow):
         self.top_k = 1  # Number of switches to select for redistribution
         self.latency_neighbor_limit = 3  # Max neighbors considered per switch for latency-aware redistribution
         self.latency_conversion_factor = 0.02  # ms per canvas unit distance (tunable latency scaling)
+        # Optional imbalance gate on the redistribution trigger (None disables a condition): strategies
+        # only run while max_load - min_load > abs_imbalance_threshold and max_load > min_load * rel_imbalance_threshold
+        self.abs_imbalance_threshold: Optional[float] = None
+        self.rel_imbalance_threshold: Optional[float] = None
+        self._debug = False  # Print [DEBUG]/[THRESHOLD] traces of the redistribution strategies
         
         # Logging for graph generation
-        self.load_history = {}  # {switch_id: [(timestamp, load), ...]}
-        self.power_history = {}  # {switch_id: [(timestamp, power), ...]} for energy-aware tracking
+        self.load_history: Dict[str, HistoryBuffer] = {}  # {switch_id: (timestamp, load) samples}
+        self.power_history: Dict[str, HistoryBuffer] = {}  # {switch_id: (timestamp, power) samples} for energy-aware tracking
         self.redistribution_log = []  # [(timestamp, event_description), ...]
         self.log_counter = 0  # Counter to log every 5 seconds (10 ticks of 500ms)
         
@@ -404,13 +966,37 @@ class NetworkSimulator(QMainWindow):
         self.dynamic_threshold_minimum = 20.0  # Minimum threshold (don't go below this)
         self.initial_load_threshold = 50.0  # Store initial threshold for reset
         
+        # Cached switch adjacency/base loads (see _switch_topology); None until next use
+        self._topology: Optional[SwitchTopology] = None
+        
+        # Pending switch-load recomputation after topology edits (see _schedule_recalc)
+        self._loads_dirty = False
+        self._recalc_scheduled = False
+        self._batch_depth = 0
+        
+        # (thread, worker) pairs of graph renders in flight (see generate_graph)
+        self._plot_jobs: List[Tuple[QThread, PlotWorker]] = []
+        
+        # Set when a redistribution deferred its reliability update (see _deferred_reliability)
+        self._reliability_pending = False
+        
         # Create UI
         self.setup_ui()
         
+        # Compile the per-tick kernel up front so the first tick does not stall
+        sim_kernel.warmup()
+        
         # Simulation timer
         self.sim_timer = QTimer()
         self.sim_timer.timeout.connect(self.run_simulation_step)
         
+        # Stats table refresh is debounced: update_statistics() only marks it dirty
+        self._stats_dirty = False
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(1000)
+        self.stats_timer.timeout.connect(self._flush_stats)
+        self.stats_timer.start()
+        
     def setup_ui(self):
         """Setup the user interface."""
         central_widget = QWidget()
@@ -422,11 +1008,17 @@ class NetworkSimulator(QMainWindow):
         
         # Graphics view for network playground
         self.scene = QGraphicsScene()
+        # Small scenes hit-test fine with linear scans; a BSP index would be rebuilt on every drag
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.scene.setSceneRect(0, 0, 1000, 700)
         self.scene.setBackgroundBrush(QBrush(QColor(240, 240, 240)))
         
         self.view = QGraphicsView(self.scene)
         self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Repaint only the changed regions; every item's paint() sets the pen, brush and font it
+        # uses, so the view can skip saving and restoring painter state around each item
+        self.view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
         self.view.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         
         canvas_layout.addWidget(self.view)
@@ -475,6 +1067,24 @@ class NetworkSimulator(QMainWindow):
         control_layout.addWidget(QLabel("Threshold:"))
         control_layout.addWidget(self.threshold_spinbox)
         
+        # Imbalance gate on the redistribution trigger; the minimum value disables a condition
+        self.abs_imbalance_spinbox = QSpinBox()
+        self.abs_imbalance_spinbox.setMinimum(0)
+        self.abs_imbalance_spinbox.setMaximum(1000)
+        self.abs_imbalance_spinbox.setSpecialValueText("Off")
+        self.abs_imbalance_spinbox.valueChanged.connect(self.update_abs_imbalance_threshold)
+        control_layout.addWidget(QLabel("Min Load Spread:"))
+        control_layout.addWidget(self.abs_imbalance_spinbox)
+        
+        self.rel_imbalance_spinbox = QDoubleSpinBox()
+        self.rel_imbalance_spinbox.setMinimum(1.0)
+        self.rel_imbalance_spinbox.setMaximum(100.0)
+        self.rel_imbalance_spinbox.setSingleStep(0.1)
+        self.rel_imbalance_spinbox.setSpecialValueText("Off")
+        self.rel_imbalance_spinbox.valueChanged.connect(self.update_rel_imbalance_threshold)
+        control_layout.addWidget(QLabel("Min Load Ratio:"))
+        control_layout.addWidget(self.rel_imbalance_spinbox)
+        
         self.reduction_spinbox = QSpinBox()
         self.reduction_spinbox.setMinimum(1)
         self.reduction_spinbox.setMaximum(100)
@@ -515,12 +1125,13 @@ class NetworkSimulator(QMainWindow):
         
         # Statistics tab - Switches only
         # Stats table will be added as dock widget
-        self.stats_table = QTableWidget()
-        self.stats_table.setColumnCount(8)
-        self.stats_table.setHorizontalHeaderLabels(["Switch", "Load", "Power (W)", "Req/s", "Reliability", "Lambda", "Alpha", "Op.Time"])
+        self.stats_model = SwitchStatsModel(self)
+        self.stats_model.edited.connect(self.on_stats_edited)
+        self.stats_table = QTableView()
+        self.stats_table.setModel(self.stats_model)
+        self.stats_table.verticalHeader().setVisible(False)
         header = self.stats_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.stats_table.cellChanged.connect(self.on_stats_cell_changed)
         
         # Graph button
         btn_graph = QPushButton("Generate Load Graph")
@@ -557,14 +1168,28 @@ class NetworkSimulator(QMainWindow):
         dock_widget.setFloating(False)
         dock_widget.setGeometry(0, 0, 400, 300)
     
+    def _register_component(self, component: NetworkComponent):
+        """Store `component` under its id in `components` and its type list."""
+        if component.id in self.components:
+            # replacing a component keeps its place in `components`, so rebuild the type lists
+            self.components[component.id] = component
+            for components in self.components_by_type.values():
+                components.clear()
+            for c in self.components.values():
+                self.components_by_type[c.type].append(c)
+        else:
+            self.components[component.id] = component
+            self.components_by_type[component.type].append(component)
+        self._topology = None
+    
     def add_component(self, component_type: ComponentType):
         """Add a new component to the network."""
         # Random position
         x = random.uniform(100, 800)
         y = random.uniform(100, 600)
         
-        component = NetworkComponent(component_type, x, y)
-        self.components[component.id] = component
+        component = NetworkComponent.create(component_type, x, y)
+        self._register_component(component)
         
         # Add graphics item
         graphics_item = GraphicsNetworkComponent(component)
@@ -574,23 +1199,18 @@ class NetworkSimulator(QMainWindow):
         # If this is a switch and simulation is running, initialize load_history for it
         if component_type == ComponentType.SWITCH and self.simulation_running:
             if component.id not in self.load_history:
-                self.load_history[component.id] = []
+                self.load_history[component.id] = HistoryBuffer()
                 # Add initial data point with current time
-                self.load_history[component.id].append((self.simulation_time, component.current_load))
+                self.load_history[component.id].append(self.simulation_time, component.current_load)
             if component.id not in self.power_history:
-                self.power_history[component.id] = []
+                self.power_history[component.id] = HistoryBuffer()
                 # Add initial power data point
-                self.power_history[component.id].append((self.simulation_time, component.power_consumption))
+                self.power_history[component.id].append(self.simulation_time, component.power_consumption)
         
-        # Recalculate switch loads and update stats
-        # If simulation is running, preserve cumulative request load
-        if self.simulation_running:
-            self.calculate_switch_loads(include_requests=True)
-        else:
-            self.calculate_switch_loads(include_requests=False)
-        self.update_statistics()
+        # Recalculate switch loads and update stats (coalesced, see _schedule_recalc)
+        self._schedule_recalc()
         
-        QMessageBox.information(self, "Success", f"Added {component_type.value} at ({x:.0f}, {y:.0f})")
+        self.statusBar().showMessage(f"Added {component_type.value} at ({x:.0f}, {y:.0f})", 2000)
     
     def create_connection(self):
         """Create connection between selected items."""
@@ -605,19 +1225,14 @@ class NetworkSimulator(QMainWindow):
         
         source.connect_to(dest.id)
         dest.connect_to(source.id)
+        self._topology = None
         
         # Create graphics connection
         conn = GraphicsConnection(selected_items[0], selected_items[1], self.latency_conversion_factor)
-        self.connections_graphics.append(conn)
-        self.scene.addItem(conn)
+        self._add_connection_item(conn)
         
-        # Recalculate switch loads after connection change
-        # If simulation is running, preserve cumulative request load
-        if self.simulation_running:
-            self.calculate_switch_loads(include_requests=True)
-        else:
-            self.calculate_switch_loads(include_requests=False)
-        self.update_statistics()
+        # Recalculate switch loads after connection change (coalesced, see _schedule_recalc)
+        self._schedule_recalc()
         
         # If either connected component is a switch that was over_threshold, trigger redistribution
         if self.simulation_running and (self.load_distribution_strategy == LoadDistributionStrategy.STATIC_THRESHOLD_RELIABILITY_SENSITIVE or \
@@ -626,13 +1241,57 @@ class NetworkSimulator(QMainWindow):
                (dest.type == ComponentType.SWITCH and dest.over_threshold):
                 print("[Info] New connection to over-threshold switch, triggering redistribution...")
                 
+                # Redistribution needs the loads of the new topology now
+                self._flush_recalc()
+                
                 # Trigger the appropriate redistribution method
                 if self.load_distribution_strategy == LoadDistributionStrategy.STATIC_THRESHOLD_RELIABILITY_SENSITIVE:
                     self.apply_static_threshold_redistribution()
                 else:
                     self.apply_dynamic_threshold_redistribution()
         
-        QMessageBox.information(self, "Connected", f"{source.id} → {dest.id}")
+        self.statusBar().showMessage(f"Connected {source.id} → {dest.id}", 2000)
+    
+    def _add_connection_item(self, conn: GraphicsConnection):
+        """Add a connection line to the scene and index it by its component pair."""
+        self.connections_graphics.append(conn)
+        key = frozenset((conn.source_item.component.id, conn.dest_item.component.id))
+        self.edge_index.setdefault(key, []).append(conn)
+        self.scene.addItem(conn)
+    
+    def _schedule_recalc(self):
+        """Mark switch loads stale and recompute them (with stats) once control returns to the event loop.
+        
+        Several topology edits in a row, or any number inside `_batch()`, share one recomputation.
+        """
+        self._loads_dirty = True
+        if not self._recalc_scheduled and not self._batch_depth:
+            self._recalc_scheduled = True
+            QTimer.singleShot(0, self._do_recalc)
+    
+    def _do_recalc(self):
+        self._recalc_scheduled = False
+        self._flush_recalc()
+    
+    def _flush_recalc(self):
+        """Run a pending switch-load recomputation now (no-op when loads are current)."""
+        if not self._loads_dirty:
+            return
+        self._loads_dirty = False
+        # If simulation is running, preserve cumulative request load
+        self.calculate_switch_loads(include_requests=self.simulation_running)
+        self.update_statistics()
+    
+    @contextmanager
+    def _batch(self):
+        """Defer switch-load recomputation until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush_recalc()
     
     def remove_connection(self):
         """Remove connection between selected items."""
@@ -647,22 +1306,31 @@ class NetworkSimulator(QMainWindow):
         
         source.disconnect_from(dest.id)
         dest.disconnect_from(source.id)
+        self._topology = None
         
         # Remove graphics connection
-        self.connections_graphics = [c for c in self.connections_graphics 
-                                     if not ((c.source_item.component == source and c.dest_item.component == dest) or
-                                            (c.source_item.component == dest and c.dest_item.component == source))]
+        for conn in self.edge_index.pop(frozenset((source.id, dest.id)), ()):
+            conn.detach()
+            if conn.scene() is not None:
+                self.scene.removeItem(conn)
+            self.connections_graphics.remove(conn)
         
-        # Recalculate switch loads after connection change
-        # If simulation is running, preserve cumulative request load
-        if self.simulation_running:
-            self.calculate_switch_loads(include_requests=True)
-        else:
-            self.calculate_switch_loads(include_requests=False)
-        self.update_statistics()
+        # Recalculate switch loads after connection change (coalesced, see _schedule_recalc)
+        self._schedule_recalc()
         
         self.scene.update()
     
+    @property
+    def load_distribution_strategy(self) -> LoadDistributionStrategy:
+        return self._load_distribution_strategy
+    
+    @load_distribution_strategy.setter
+    def load_distribution_strategy(self, strategy: LoadDistributionStrategy):
+        # Bind the strategy's redistribution method once instead of dispatching on every tick
+        self._load_distribution_strategy = strategy
+        name = self.REDISTRIBUTION_METHODS.get(strategy)
+        self._redistribute = getattr(self, name) if name else None
+    
     def update_load_distribution_strategy(self, index: int):
         """Update load distribution strategy."""
         strategies = list(LoadDistributionStrategy)
@@ -671,19 +1339,34 @@ class NetworkSimulator(QMainWindow):
     
     def update_load_threshold(self, value: int):
         """Update load threshold for redistribution."""
-        print(f"[DEBUG] update_load_threshold called: {value}")
+        if self._debug:
+            print(f"[DEBUG] update_load_threshold called: {value}")
         self.load_threshold = float(value)
         self.initial_load_threshold = float(value)  # Update initial threshold for dynamic strategy
     
     def update_threshold_reduction(self, value: int):
         """Update threshold reduction factor for dynamic strategy."""
         self.dynamic_threshold_reduction = float(value)
-        print(f"[DEBUG] Threshold reduction factor updated to: {value}")
+        if self._debug:
+            print(f"[DEBUG] Threshold reduction factor updated to: {value}")
+    
+    def update_abs_imbalance_threshold(self, value: int):
+        """Update the minimum max-min load spread that lets redistribution run (0 disables it)."""
+        self.abs_imbalance_threshold = float(value) if value > 0 else None
+        if self._debug:
+            print(f"[DEBUG] Absolute imbalance threshold updated to: {self.abs_imbalance_threshold}")
+    
+    def update_rel_imbalance_threshold(self, value: float):
+        """Update the minimum max/min load ratio that lets redistribution run (1.0 disables it)."""
+        self.rel_imbalance_threshold = value if value > 1.0 else None
+        if self._debug:
+            print(f"[DEBUG] Relative imbalance threshold updated to: {self.rel_imbalance_threshold}")
     
     def update_top_k(self, value: int):
         """Update top K switches for redistribution selection."""
         self.top_k = value
-        print(f"[DEBUG] Top K switches updated to: {value}")
+        if self._debug:
+            print(f"[DEBUG] Top K switches updated to: {value}")
     
     def calculate_latency_ms(self, switch_a: NetworkComponent, switch_b: NetworkComponent) -> float:
         """Estimate latency between two switches based on their positions."""
@@ -692,6 +1375,144 @@ class NetworkSimulator(QMainWindow):
         distance = math.hypot(dx, dy)
         return distance * self.latency_conversion_factor
 
+    def _top_k_switches(self, eligible: List[NetworkComponent], key: str, descending: bool = False) -> List[NetworkComponent]:
+        """Return up to `self.top_k` of `eligible` with the lowest (or highest) `key`, best first."""
+        if key in ComponentTable.COLUMNS:
+            rows = np.fromiter((s._row for s in eligible), dtype=np.intp, count=len(eligible))
+            values = getattr(NetworkComponent.table, key)[rows]
+        else:
+            values = np.fromiter((getattr(s, key) for s in eligible), dtype=np.float64, count=len(eligible))
+        order = top_k_order(-values if descending else values, self.top_k)
+        return [eligible[i] for i in order.tolist()]
+    
+    def _switches_over(self, topo: SwitchTopology) -> List[NetworkComponent]:
+        """Return the switches of `topo` at or above the load threshold, in topology order."""
+        loads = np.take(NetworkComponent.table.current_load, topo.rows, out=topo.loads_buf)
+        over = np.flatnonzero(np.greater_equal(loads, self.load_threshold, out=topo.over_buf))
+        return [topo.switches[i] for i in over.tolist()]
+    
+    def _redistribute_sources(self, topo: SwitchTopology, sources: List[str],
+                              state: Optional[SwitchState] = None) -> np.ndarray:
+        """Redistribute the full load of each of `sources` over the switch graph (beta = 1).
+        
+        Works on the table's current switch loads as an array indexed like `topo.switches`;
+        `state` overrides the neighbourhoods of `topo.state`. Returns the new load per switch.
+        """
+        state = topo.state if state is None else state
+        # the redistribution reads the snapshot and returns a new array, so the scratch buffer can hold it
+        loads = np.take(NetworkComponent.table.current_load, topo.rows, out=topo.loads_buf)
+        after = proportional_redistribute_sources_full(state.with_loads(loads), None, sources, None, beta=1.0)
+        return after.loads[:len(topo.switches)]
+    
+    def _apply_redistributed_loads(self, topo: SwitchTopology, new_loads: np.ndarray,
+                                   refresh_reliability: bool = True) -> List[NetworkComponent]:
+        """Write redistributed loads (indexed like `topo.switches`) back into the table in one vectorized update.
+        
+        `cumulative_request_load` becomes whatever the new load adds on top of the switch's base load,
+        and load percentage and reliability are refreshed for the switches whose load actually changed.
+        With `refresh_reliability=False` reliability is only marked stale, for the enclosing
+        `_deferred_reliability` block to recompute. Returns the updated switches.
+        """
+        rows = topo.rows
+        table = NetworkComponent.table
+        # only the sources' neighbourhoods move; the other rows would recompute identical values
+        touched = rows[new_loads != table.current_load[rows]]
+        table.current_load[rows] = new_loads
+        table.cumulative_request_load[rows] = np.maximum(0, new_loads - topo.base_load)
+        table.update_load_pct(touched)
+        if refresh_reliability:
+            self._update_reliability(touched)
+        else:
+            self._reliability_pending = True
+        return topo.switches
+    
+    @contextmanager
+    def _deferred_reliability(self, topo: SwitchTopology):
+        """Recalculate reliability of the redistributed switches once, with their final loads.
+        
+        Redistributions applied inside the block with `refresh_reliability=False` only mark reliability
+        stale; it is recomputed for all switches when the block exits, including early returns.
+        """
+        self._reliability_pending = False
+        try:
+            yield
+        finally:
+            if self._reliability_pending:
+                self._reliability_pending = False
+                self._update_reliability(topo.rows)
+    
+    def _imbalanced(self, topo: SwitchTopology) -> bool:
+        """Whether the switch loads pass the abs/rel imbalance gate (always true while it is unset)."""
+        if self.abs_imbalance_threshold is None and self.rel_imbalance_threshold is None:
+            return True
+        loads = np.take(NetworkComponent.table.current_load, topo.rows, out=topo.loads_buf)
+        max_load, min_load = loads.max(), loads.min()
+        if self.abs_imbalance_threshold is not None and max_load - min_load <= self.abs_imbalance_threshold:
+            return False
+        if self.rel_imbalance_threshold is not None and max_load <= min_load * self.rel_imbalance_threshold:
+            return False
+        return True
+    
+    def _update_reliability(self, rows):
+        """Recompute the AFTM reliability of the given table rows from their current loads."""
+        table = NetworkComponent.table
+        sim_kernel.update_reliability(np.asarray(rows, dtype=np.intp), table.operational_time, table.current_load,
+                                      table.base_lambda, table.alpha, table.reliability)
+    
+    def _switch_topology(self) -> SwitchTopology:
+        """Return the switch adjacency and base loads, rebuilding them after topology changes."""
+        if self._topology is None:
+            switches = list(self.switches)
+            indptr = [0]
+            indices = []
+            neighbor_ids = []
+            for switch in switches:
+                for neighbor_id in switch.connections:
+                    neighbor = self.components.get(neighbor_id)
+                    if neighbor:
+                        indices.append(neighbor._row)
+                        neighbor_ids.append(neighbor_id)
+                indptr.append(len(indices))
+            
+            # neighbors are classified by their type code column, not per object
+            indices = np.asarray(indices, dtype=np.intp)
+            codes = NetworkComponent.table.type_code[indices]
+            weights = BASE_LOAD_BY_CODE[codes]
+            is_switch = (codes == SWITCH_CODE).tolist()
+            neighbors_map = {
+                switch.id: [neighbor_ids[j] for j in range(indptr[i], indptr[i + 1]) if is_switch[j]]
+                for i, switch in enumerate(switches)
+            }
+            
+            degrees = {sid: len(nbrs) for sid, nbrs in neighbors_map.items()}
+            nk_map = precompute_nk(neighbors_map)
+            state = SwitchState.from_dicts(dict.fromkeys(neighbors_map, 0.0), degrees, neighbors_map, nk_map)
+            nk_offsets, nk_indices = build_nk_csr(range(len(switches)), state.nk_idx)
+            indptr = np.asarray(indptr, dtype=np.intp)
+            # segment id of every CSR entry; bincount sums each switch's entries (empty rows give 0)
+            seg = np.repeat(np.arange(len(switches)), np.diff(indptr))
+            self._topology = SwitchTopology(
+                switches=switches,
+                rows=np.fromiter((s._row for s in switches), dtype=np.intp, count=len(switches)),
+                indptr=indptr,
+                indices=indices,
+                weights=weights,
+                base_load=np.bincount(seg, weights=weights, minlength=len(switches)),
+                endpoints=np.bincount(seg, weights=ENDPOINT_BY_CODE[codes], minlength=len(switches)),
+                index={s.id: i for i, s in enumerate(switches)},
+                neighbors_map=neighbors_map,
+                degrees=degrees,
+                nk_map=nk_map,
+                any_can_redistribute=any(neighbors_map.values()),
+                state=state,
+                eligible=np.flatnonzero(state.degrees > 0),
+                nk_offsets=nk_offsets,
+                nk_indices=nk_indices,
+                loads_buf=np.empty(len(switches), dtype=np.float64),
+                over_buf=np.empty(len(switches), dtype=np.bool_),
+            )
+        return self._topology
+
     def calculate_switch_loads(self, include_requests=False):
         """Calculate load for all switches based on connections and incoming requests.
         
@@ -701,35 +1522,28 @@ class NetworkSimulator(QMainWindow):
         Rules:
         - Base load (static): 20 × (connected servers) + 5 × (connected switches) + 10 × (connected SANs)
         - Dynamic load (per second, only if include_requests=True): += cumulative_request_load
+        
+        Base loads come from the cached switch topology; loads and reliabilities of all switches
+        are then updated in one vectorized pass over the component table.
         """
-        for component in self.components.values():
-            if component.type == ComponentType.SWITCH:
-                base_load = 0
-                
-                # Calculate base load from connected components
-                for neighbor_id in component.connections:
-                    neighbor = self.components.get(neighbor_id)
-                    if neighbor:
-                        if neighbor.type == ComponentType.SERVER:
-                            base_load += 20
-                        elif neighbor.type == ComponentType.SWITCH:
-                            base_load += 5
-                        elif neighbor.type == ComponentType.SAN:
-                            base_load += 10
-                
-                # Add cumulative request load only during simulation
-                if include_requests:
-                    component.current_load = max(0, base_load + component.cumulative_request_load)
-                else:
-                    component.current_load = max(0, base_load)
-                
-                # Update reliability based on current load and operational time
-                component.reliability = reliability_R(
-                    component.operational_time,
-                    component.current_load,
-                    component.base_lambda,
-                    component.alpha
-                )
+        topo = self._switch_topology()
+        if not topo.switches:
+            return
+        
+        table = NetworkComponent.table
+        rows = topo.rows
+        
+        # Add cumulative request load only during simulation
+        if include_requests:
+            loads = np.maximum(0, topo.base_load + table.cumulative_request_load[rows])
+        else:
+            loads = np.maximum(0, topo.base_load)
+        table.current_load[rows] = loads
+        table.update_load_pct(rows)
+        
+        # Update reliability based on current load and operational time
+        sim_kernel.update_reliability(rows, table.operational_time, table.current_load, table.base_lambda,
+                                      table.alpha, table.reliability)
     
     def start_simulation(self):
         """Start network simulation."""
@@ -753,24 +1567,25 @@ class NetworkSimulator(QMainWindow):
         
         # Reset dynamic threshold if using dynamic strategy (only on first start)
         if self.load_distribution_strategy == LoadDistributionStrategy.DYNAMIC_THRESHOLD_RELIABILITY_SENSITIVE:
-            print(f"[DEBUG] Resetting threshold to initial: {self.initial_load_threshold}")
+            if self._debug:
+                print(f"[DEBUG] Resetting threshold to initial: {self.initial_load_threshold}")
             self.load_threshold = self.initial_load_threshold
         
         # Initialize logging
         self.load_history = {}
         self.power_history = {}  # Initialize power history for energy-aware tracking
         self.redistribution_log = []
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
+        switches = self.switches
         for switch in switches:
-            self.load_history[switch.id] = []
-            self.power_history[switch.id] = []  # Initialize power history
+            self.load_history[switch.id] = HistoryBuffer()
+            self.power_history[switch.id] = HistoryBuffer()  # Initialize power history
         
         self.calculate_switch_loads(include_requests=True)  # Start including request load
         
         # Log initial state
         for switch in switches:
-            self.load_history[switch.id].append((self.simulation_time, switch.current_load))
-            self.power_history[switch.id].append((self.simulation_time, switch.power_consumption))  # Log initial power
+            self.load_history[switch.id].append(self.simulation_time, switch.current_load)
+            self.power_history[switch.id].append(self.simulation_time, switch.power_consumption)  # Log initial power
         
         self.update_statistics()  # Show initial stats
         self.sim_timer.start(500)  # Update every 500ms
@@ -794,10 +1609,10 @@ class NetworkSimulator(QMainWindow):
     
     def reset_switch_loads(self):
         """Reset current load and cumulative request load for all switches."""
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
+        switches = self.switches
 
         if not switches:
-            QMessageBox.information(self, "Reset Loads", "No switches to reset.")
+            self.statusBar().showMessage("No switches to reset.", 2000)
             return
 
         for switch in switches:
@@ -805,13 +1620,8 @@ class NetworkSimulator(QMainWindow):
             switch.current_load = 0.0
             switch.over_threshold = False
             switch.sleep_mode = False
-            switch.reliability = reliability_R(
-                switch.operational_time,
-                0.0,
-                switch.base_lambda,
-                switch.alpha
-            )
             switch.calculate_power_consumption()
+        self._update_reliability([s._row for s in switches])
 
         # Recompute loads to include any static baseline contribution
         self.calculate_switch_loads(include_requests=self.simulation_running)
@@ -820,9 +1630,9 @@ class NetworkSimulator(QMainWindow):
         for switch in switches:
             switch.calculate_power_consumption()
             if switch.id in self.load_history:
-                self.load_history[switch.id].append((self.simulation_time, switch.current_load))
+                self.load_history[switch.id].append(self.simulation_time, switch.current_load)
             if switch.id in self.power_history:
-                self.power_history[switch.id].append((self.simulation_time, switch.power_consumption))
+                self.power_history[switch.id].append(self.simulation_time, switch.power_consumption)
 
         self.update_statistics()
 
@@ -831,73 +1641,63 @@ class NetworkSimulator(QMainWindow):
             "Manual reset: all switch loads cleared"
         ))
 
-        QMessageBox.information(self, "Reset Loads", "Switch loads have been reset.")
+        self.statusBar().showMessage("Switch loads have been reset.", 2000)
 
     def run_simulation_step(self):
         """Execute one simulation step."""
         self.simulation_time += 1
         
+        # Topology edits since the last tick may not have been applied yet
+        self._flush_recalc()
+        
         # Skip simulation updates if paused, but still update display
         if not self.simulation_paused:
             # Accumulate request load for switches each second
             # increment = incoming_requests × (connected_servers + connected_sans) × 0.1
-            for component in self.components.values():
-                if component.type == ComponentType.SWITCH:
-                    num_servers = sum(1 for neighbor_id in component.connections 
-                                    if self.components.get(neighbor_id) and 
-                                    self.components[neighbor_id].type == ComponentType.SERVER)
-                    num_sans = sum(1 for neighbor_id in component.connections 
-                                  if self.components.get(neighbor_id) and 
-                                  self.components[neighbor_id].type == ComponentType.SAN)
-                    total_endpoints = num_servers + num_sans
-                    increment = component.incoming_requests * total_endpoints * 0.1
-                    component.cumulative_request_load += increment
-                    
-                    # Increment operational time and calculate reliability using AFTM
-                    component.operational_time += 0.5  # 500ms tick
-                    # Reliability: R(t,L) = exp(-lambda * t * L^alpha)
-                    component.reliability = reliability_R(
-                        component.operational_time,
-                        component.current_load,
-                        component.base_lambda,
-                        component.alpha
-                    )
-            
-            # Recalculate loads after request increment (include_requests=True during simulation)
-            self.calculate_switch_loads(include_requests=True)
+            # then advance operational time by the 500ms tick and recompute loads and
+            # AFTM reliability R(t,L) = exp(-lambda * t * L^alpha), all in one kernel call
+            topo = self._switch_topology()
+            table = NetworkComponent.table
+            over_mask = sim_kernel.step(topo.rows, topo.base_load, topo.endpoints, table.incoming_requests,
+                                        table.cumulative_request_load, table.operational_time,
+                                        table.current_load, table.bandwidth_capacity, table.load_pct,
+                                        table.reliability, table.base_lambda, table.alpha, 0.5,
+                                        self.load_threshold, topo.over_buf)
             
-            # Apply load distribution strategy if enabled
-            if self.load_distribution_strategy == LoadDistributionStrategy.STATIC_THRESHOLD_RELIABILITY_SENSITIVE:
-                self.apply_static_threshold_redistribution()
-            elif self.load_distribution_strategy == LoadDistributionStrategy.STATIC_THRESHOLD_LOAD_SENSITIVE:
-                self.apply_static_threshold_load_sensitive_redistribution()
-            elif self.load_distribution_strategy == LoadDistributionStrategy.DYNAMIC_THRESHOLD_RELIABILITY_SENSITIVE:
-                self.apply_dynamic_threshold_reliability_sensitive_redistribution()
-            elif self.load_distribution_strategy == LoadDistributionStrategy.DYNAMIC_THRESHOLD_LOAD_SENSITIVE:
-                self.apply_dynamic_threshold_load_sensitive_redistribution()
-            elif self.load_distribution_strategy == LoadDistributionStrategy.ENERGY_AWARE_OPTIMIZATION:
-                self.apply_energy_aware_redistribution()
-            elif self.load_distribution_strategy == LoadDistributionStrategy.LATENCY_AWARE:
-                self.apply_latency_aware_redistribution()
-        
-        # Update graphics and stats
-        self.scene.update()
+            # Apply load distribution strategy if enabled. Strategies only act on switches at/over
+            # the threshold; when there are none (or the loads are too even to be worth moving, see
+            # _imbalanced), the over_threshold flags just follow the tick's mask
+            if self._redistribute is not None:
+                if over_mask.any() and self._imbalanced(topo):
+                    self._redistribute()
+                else:
+                    for switch, over in zip(topo.switches, over_mask.tolist()):
+                        switch.over_threshold = over
+        
+        # Update stats; switch items repaint themselves when their color changes. Connection lines
+        # depend only on endpoint positions, which repaint them on moves, so a tick leaves them alone
         self.update_statistics()
     
-    def apply_static_threshold_redistribution(self):
-        """Apply static threshold reliability-sensitive load redistribution.
+    def _apply_redistribution(self, key: str, descending: bool = False, dynamic: bool = False,
+                              log_label: str = "Redistribution"):
+        """Shared loop of the static and dynamic threshold strategies.
         
         Logic:
-        - If any load >= threshold: trigger redistribution
-        - Select top K switches with LOWEST reliability (that have neighbors)
-        - Redistribute load from those selected switches
-        - If all below threshold after redistribution: success
+        - If any load >= threshold: trigger redistribution (max 4 iterations)
+        - Each iteration selects the top K switches with neighbors by `key` (lowest first,
+          highest with `descending`) and redistributes their full load; an iteration that moves
+          no load ends the loop early, since the remaining ones would repeat it
+        - If all below threshold after redistribution: success; `dynamic` strategies then lower
+          the threshold by dynamic_threshold_reduction (min: dynamic_threshold_minimum)
         - If still above after 4 iterations: show failure dialog and PAUSE
+        
+        `log_label` names the strategy in redistribution_log entries.
         """
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
+        topo = self._switch_topology()
+        switches = topo.switches
         
         # Find switches over threshold
-        switches_over = [s for s in switches if s.current_load >= self.load_threshold]
+        switches_over = self._switches_over(topo)
         
         if not switches_over:
             # Clear over_threshold flag for all if none are over
@@ -905,23 +1705,16 @@ class NetworkSimulator(QMainWindow):
                 s.over_threshold = False
             return  # No redistribution needed
         
-        print(f"[DEBUG] Redistribution triggered! Switches over threshold: {[s.id for s in switches_over]}")
-        print(f"[DEBUG] Top K setting: {self.top_k}")
-        
-        # Build neighbors map from actual network connections
-        neighbors_map = {}
-        for switch in switches:
-            neighbors_map[switch.id] = [neighbor_id for neighbor_id in switch.connections 
-                                        if self.components.get(neighbor_id) and 
-                                        self.components[neighbor_id].type == ComponentType.SWITCH]
+        if self._debug:
+            print(f"[DEBUG] {log_label} triggered at threshold {self.load_threshold:.1f}! "
+                  f"Switches over threshold: {[s.id for s in switches_over]}")
+            print(f"[DEBUG] Top K setting: {self.top_k}")
         
-        # Build degrees dictionary (number of connected switches)
-        degrees = {s.id: len(neighbors_map[s.id]) for s in switches}
+        # Switch-to-switch degrees (cached with the topology)
+        degrees = topo.degrees
         
         # Check if ANY switch can actually redistribute (has neighbors)
-        any_can_redistribute = any(degrees[s.id] > 0 for s in switches)
-        
-        if not any_can_redistribute:
+        if not topo.any_can_redistribute:
             # No switches can redistribute - PAUSE and show failure dialog
             for s in switches_over:
                 s.over_threshold = True
@@ -933,432 +1726,195 @@ class NetworkSimulator(QMainWindow):
         iteration = 0
         max_iterations = 4
         
-        while iteration < max_iterations:
-            iteration += 1
-            
-            # Find current switches over threshold
-            switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-            
-            if not switches_over:
+        if sim_kernel.redistribution_loop is not None and not self._debug:
+            # The whole loop as one compiled call (the Python loop below prints the debug traces)
+            iteration, redistributed, success = self._compiled_redistribution(topo, key, max_iterations)
+            if dynamic:
+                for i in range(1, redistributed + 1):
+                    self.redistribution_log.append((
+                        self.simulation_time,
+                        f"Redistribution iteration {i} ({log_label})."
+                    ))
+            if success:
                 # SUCCESS: All switches are now below threshold
                 for s in switches:
                     s.over_threshold = False
+                if dynamic:
+                    self._reduce_threshold(log_label, "early success")
                 return  # No pause needed
-            
-            # Select top K switches with LOWEST reliability that have neighbors
-            eligible_switches = [s for s in switches if degrees[s.id] > 0]
-            eligible_switches.sort(key=lambda s: s.reliability)  # Lowest reliability first
-            top_k_switches = eligible_switches[:min(self.top_k, len(eligible_switches))]
-            sources_to_redistribute = [s.id for s in top_k_switches]
-            
-            print(f"[DEBUG] Iteration {iteration}: Selected switches by lowest reliability: {[s.id for s in top_k_switches]}")
-            print(f"[DEBUG] Their loads: {[(s.id, s.current_load) for s in top_k_switches]}")
-            print(f"[DEBUG] Their reliabilities: {[(s.id, s.reliability) for s in top_k_switches]}")
-            
-            if not sources_to_redistribute:
-                # No more switches can redistribute - break loop
-                break
-            
-            # Get current loads for redistribution algorithm
-            current_loads = {s.id: s.current_load for s in switches}
-            
-            # Call redistribution algorithm
-            try:
-                loads_after = proportional_redistribute_sources_full(
-                    loads=current_loads.copy(),
-                    degrees=degrees,
-                    sources=sources_to_redistribute,
-                    neighbors_map=neighbors_map,
-                    beta=1.0
-                )
-            except Exception as e:
-                print(f"[Error] Redistribution failed: {e}")
-                return
-            
-            # Apply the redistributed loads to switches
-            for switch in switches:
-                if switch.id in loads_after:
-                    new_load = loads_after[switch.id]
-                    switch.current_load = new_load
-                    
-                    # Update cumulative_request_load to match the new load
-                    base_load = 0
-                    for neighbor_id in switch.connections:
-                        neighbor = self.components.get(neighbor_id)
-                        if neighbor:
-                            if neighbor.type == ComponentType.SERVER:
-                                base_load += 20
-                            elif neighbor.type == ComponentType.SWITCH:
-                                base_load += 5
-                            elif neighbor.type == ComponentType.SAN:
-                                base_load += 10
-                    
-                    switch.cumulative_request_load = max(0, new_load - base_load)
-                    
-                    # Recalculate reliability with new load
-                    switch.reliability = reliability_R(
-                        switch.operational_time,
-                        switch.current_load,
-                        switch.base_lambda,
-                        switch.alpha
-                    )
-        
-        # Log redistribution event
-        switched_ids = [s for s in switches_over]
-        switch_names = ", ".join([s.id for s in switched_ids])
-        self.redistribution_log.append((
-            self.simulation_time,
-            f"Redistribution (iteration {iteration}): {switch_names}"
-        ))
+            # switches over threshold at the start of the last iteration
+            switches_over = [switches[i] for i in np.flatnonzero(topo.over_buf).tolist()]
+            self._finish_redistribution(topo, switches_over, iteration, dynamic, log_label)
+            return
+        
+        # Only reliability-keyed selection needs fresh reliabilities between iterations
+        refresh_each = key == 'reliability'
+        
+        with self._deferred_reliability(topo):
+            while iteration < max_iterations:
+                iteration += 1
+                
+                # Find current switches over threshold
+                switches_over = self._switches_over(topo)
+                
+                if not switches_over:
+                    # SUCCESS: All switches are now below threshold
+                    for s in switches:
+                        s.over_threshold = False
+                    if dynamic:
+                        self._reduce_threshold(log_label, "early success")
+                    return  # No pause needed
+                
+                # Select top K switches by `key` that have neighbors
+                eligible_switches = [s for s in switches if degrees[s.id] > 0]
+                top_k_switches = self._top_k_switches(eligible_switches, key, descending)
+                sources_to_redistribute = [s.id for s in top_k_switches]
+                
+                if self._debug:
+                    print(f"[DEBUG] Iteration {iteration}: Selected switches by {'highest' if descending else 'lowest'} "
+                          f"{key}: {sources_to_redistribute}")
+                    print(f"[DEBUG] Their loads: {[(s.id, s.current_load) for s in top_k_switches]}")
+                    if refresh_each:
+                        print(f"[DEBUG] Their reliabilities: {[(s.id, s.reliability) for s in top_k_switches]}")
+                
+                if not sources_to_redistribute:
+                    # No more switches can redistribute - break loop
+                    break
+                
+                # Call redistribution algorithm
+                try:
+                    loads_after = self._redistribute_sources(topo, sources_to_redistribute)
+                except Exception as e:
+                    print(f"[Error] Redistribution failed: {e}")
+                    return
+                
+                # Apply the redistributed loads to switches
+                stalled = np.array_equal(loads_after, NetworkComponent.table.current_load[topo.rows])
+                self._apply_redistributed_loads(topo, loads_after, refresh_reliability=refresh_each)
+                
+                if dynamic:
+                    # Log this iteration
+                    self.redistribution_log.append((
+                        self.simulation_time,
+                        f"Redistribution iteration {iteration} ({log_label})."
+                    ))
+                
+                if stalled:
+                    # Same loads select the same sources again: the remaining iterations are no-ops
+                    if self._debug:
+                        print(f"[DEBUG] Iteration {iteration} moved no load, stopping")
+                    break
+        
+        self._finish_redistribution(topo, switches_over, iteration, dynamic, log_label)
+    
+    def _compiled_redistribution(self, topo: SwitchTopology, key: str, max_iterations: int) -> Tuple[int, int, bool]:
+        """Run the redistribution iterations of `_apply_redistribution` in `sim_kernel.redistribution_loop`.
+        
+        Selects by lowest reliability for key 'reliability' and by highest current load otherwise.
+        Returns `(iteration, redistributed, success)`: the last iteration started, how many
+        redistributions were applied and whether all switches ended below the threshold;
+        `topo.over_buf` is left holding the over-threshold mask of the last iteration.
+        """
+        table = NetworkComponent.table
+        return sim_kernel.redistribution_loop(
+            topo.rows, topo.base_load, topo.eligible, topo.nk_offsets, topo.nk_indices, topo.state.deg_pow(1.0),
+            table.current_load, table.cumulative_request_load, table.bandwidth_capacity, table.load_pct,
+            table.operational_time, table.base_lambda, table.alpha, table.reliability,
+            key == 'reliability', self.top_k, self.load_threshold, max_iterations, topo.loads_buf, topo.over_buf)
+    
+    def _finish_redistribution(self, topo: SwitchTopology, switches_over: List[NetworkComponent], iteration: int,
+                               dynamic: bool, log_label: str):
+        """Log a redistribution that ran out of iterations or sources, then flag, pause or relax the threshold."""
+        switches = topo.switches
+        
+        if not dynamic:
+            # Log redistribution event
+            switch_names = ", ".join([s.id for s in switches_over])
+            self.redistribution_log.append((
+                self.simulation_time,
+                f"{log_label} (iteration {iteration}): {switch_names}"
+            ))
         
         # After loop: check if all are below threshold
-        switches_still_over = [s for s in switches if s.current_load >= self.load_threshold]
+        switches_still_over = self._switches_over(topo)
         
         # Mark switches as over_threshold
+        still_over_ids = {s.id for s in switches_still_over}
         for s in switches:
-            s.over_threshold = (s.current_load >= self.load_threshold)
+            s.over_threshold = s.id in still_over_ids
         
         if switches_still_over:
             # FAILURE: Still above threshold after 4 iterations - PAUSE and show failure dialog
             self.simulation_paused = True
             self.show_failure_dialog(switches_still_over)
+        elif dynamic:
+            # SUCCESS: All switches are below threshold after loop iterations
+            self._reduce_threshold(log_label, "after loop")
     
-    def apply_static_threshold_load_sensitive_redistribution(self):
-        """Apply static threshold load-sensitive load redistribution.
-        
-        Logic:
-        - If any load >= threshold: trigger redistribution
-        - Select top K switches with HIGHEST load (that have neighbors)
-        - Redistribute load from those selected switches
-        - If all below threshold after redistribution: success
-        - If still above after 4 iterations: show failure dialog and PAUSE
-        """
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
-        
-        # Find switches over threshold
-        switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-        
-        if not switches_over:
-            # Clear over_threshold flag for all if none are over
-            for s in switches:
-                s.over_threshold = False
-            return  # No redistribution needed
-        
-        print(f"[DEBUG] Load-Sensitive Redistribution triggered! Switches over threshold: {[s.id for s in switches_over]}")
-        print(f"[DEBUG] Top K setting: {self.top_k}")
+    def _reduce_threshold(self, log_label: str, when: str):
+        """Lower the threshold once after a successful dynamic redistribution and log it."""
+        old_threshold = self.load_threshold
+        self.load_threshold = max(self.dynamic_threshold_minimum, 
+                                 self.load_threshold - self.dynamic_threshold_reduction)
         
-        # Build neighbors map from actual network connections
-        neighbors_map = {}
-        for switch in switches:
-            neighbors_map[switch.id] = [neighbor_id for neighbor_id in switch.connections 
-                                        if self.components.get(neighbor_id) and 
-                                        self.components[neighbor_id].type == ComponentType.SWITCH]
-        
-        # Build degrees dictionary (number of connected switches)
-        degrees = {s.id: len(neighbors_map[s.id]) for s in switches}
+        if self._debug:
+            print(f"[THRESHOLD] Reduced from {old_threshold:.1f} to {self.load_threshold:.1f} ({when})")
         
-        # Check if ANY switch can actually redistribute (has neighbors)
-        any_can_redistribute = any(degrees[s.id] > 0 for s in switches)
+        # Update the spinbox to show new threshold
+        self.threshold_spinbox.blockSignals(True)
+        self.threshold_spinbox.setValue(int(self.load_threshold))
+        self.threshold_spinbox.blockSignals(False)
         
-        if not any_can_redistribute:
-            # No switches can redistribute - PAUSE and show failure dialog
-            for s in switches_over:
-                s.over_threshold = True
-            self.simulation_paused = True
-            self.show_failure_dialog(switches_over)
-            return
-        
-        # Try to redistribute (max 4 iterations)
-        iteration = 0
-        max_iterations = 4
-        
-        while iteration < max_iterations:
-            iteration += 1
-            
-            # Find current switches over threshold
-            switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-            
-            if not switches_over:
-                # SUCCESS: All switches are now below threshold
-                for s in switches:
-                    s.over_threshold = False
-                return  # No pause needed
-            
-            # Select top K switches with HIGHEST load that have neighbors
-            eligible_switches = [s for s in switches if degrees[s.id] > 0]
-            eligible_switches.sort(key=lambda s: s.current_load, reverse=True)  # Highest load first
-            top_k_switches = eligible_switches[:min(self.top_k, len(eligible_switches))]
-            sources_to_redistribute = [s.id for s in top_k_switches]
-            
-            print(f"[DEBUG] Iteration {iteration}: Selected switches by highest load: {[s.id for s in top_k_switches]}")
-            print(f"[DEBUG] Their loads: {[(s.id, s.current_load) for s in top_k_switches]}")
-            
-            if not sources_to_redistribute:
-                # No more switches can redistribute - break loop
-                break
-            
-            # Get current loads for redistribution algorithm
-            current_loads = {s.id: s.current_load for s in switches}
-            
-            # Call redistribution algorithm
-            try:
-                loads_after = proportional_redistribute_sources_full(
-                    loads=current_loads.copy(),
-                    degrees=degrees,
-                    sources=sources_to_redistribute,
-                    neighbors_map=neighbors_map,
-                    beta=1.0
-                )
-            except Exception as e:
-                print(f"[Error] Redistribution failed: {e}")
-                return
-            
-            # Apply the redistributed loads to switches
-            for switch in switches:
-                if switch.id in loads_after:
-                    new_load = loads_after[switch.id]
-                    switch.current_load = new_load
-                    
-                    # Update cumulative_request_load to match the new load
-                    base_load = 0
-                    for neighbor_id in switch.connections:
-                        neighbor = self.components.get(neighbor_id)
-                        if neighbor:
-                            if neighbor.type == ComponentType.SERVER:
-                                base_load += 20
-                            elif neighbor.type == ComponentType.SWITCH:
-                                base_load += 5
-                            elif neighbor.type == ComponentType.SAN:
-                                base_load += 10
-                    
-                    switch.cumulative_request_load = max(0, new_load - base_load)
-                    
-                    # Recalculate reliability with new load
-                    switch.reliability = reliability_R(
-                        switch.operational_time,
-                        switch.current_load,
-                        switch.base_lambda,
-                        switch.alpha
-                    )
-        
-        # Log redistribution event
-        switched_ids = [s for s in switches_over]
-        switch_names = ", ".join([s.id for s in switched_ids])
+        # Log success
         self.redistribution_log.append((
             self.simulation_time,
-            f"Load-Sensitive Redistribution (iteration {iteration}): {switch_names}"
+            f"Redistribution successful ({log_label}). New threshold: {self.load_threshold:.1f}"
         ))
+    
+    def apply_static_threshold_redistribution(self):
+        """Apply static threshold reliability-sensitive load redistribution.
         
-        # After loop: check if all are below threshold
-        switches_still_over = [s for s in switches if s.current_load >= self.load_threshold]
-        
-        # Mark switches as over_threshold
-        for s in switches:
-            s.over_threshold = (s.current_load >= self.load_threshold)
+        Selects the top K switches with LOWEST reliability (that have neighbors); see
+        `_apply_redistribution`.
+        """
+        self._apply_redistribution('reliability')
+    
+    def apply_static_threshold_load_sensitive_redistribution(self):
+        """Apply static threshold load-sensitive load redistribution.
         
-        if switches_still_over:
-            # FAILURE: Still above threshold after 4 iterations - PAUSE and show failure dialog
-            self.simulation_paused = True
-            self.show_failure_dialog(switches_still_over)
+        Selects the top K switches with HIGHEST load (that have neighbors); see
+        `_apply_redistribution`.
+        """
+        self._apply_redistribution('current_load', descending=True, log_label="Load-Sensitive Redistribution")
     
     def apply_dynamic_threshold_load_sensitive_redistribution(self):
         """Apply dynamic threshold load-sensitive load redistribution.
         
-        Similar to reliability-sensitive, but after successful redistribution, 
-        the threshold is reduced by dynamic_threshold_reduction amount.
-        Selects switches with HIGHEST load to redistribute.
-        
-        Logic:
-        - If load >= threshold: try redistribution (max 4 iterations)
-          - Select top K switches with HIGHEST load that have neighbors
-          - If all below threshold after redistribution: 
-            - Log success
-            - Reduce threshold by dynamic_threshold_reduction (min: dynamic_threshold_minimum)
-            - Continue simulation (no pause)
-          - If still above after 4 iterations: show failure dialog and PAUSE
+        Similar to reliability-sensitive, but selects switches with HIGHEST load to redistribute.
+        After a successful redistribution the threshold is reduced by dynamic_threshold_reduction;
+        see `_apply_redistribution`.
         """
-        print(f"[DEBUG] apply_dynamic_threshold_load_sensitive_redistribution called with threshold={self.load_threshold:.1f}")
-        
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
-        
-        # Find switches over threshold
-        switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-        
-        if not switches_over:
-            # Clear over_threshold flag for all if none are over
-            for s in switches:
-                s.over_threshold = False
-            return  # No redistribution needed
-        
-        # Build neighbors map from actual network connections
-        neighbors_map = {}
-        for switch in switches:
-            neighbors_map[switch.id] = [neighbor_id for neighbor_id in switch.connections 
-                                        if self.components.get(neighbor_id) and 
-                                        self.components[neighbor_id].type == ComponentType.SWITCH]
-        
-        # Build degrees dictionary (number of connected switches)
-        degrees = {s.id: len(neighbors_map[s.id]) for s in switches}
-        
-        # Check if ANY switch can actually redistribute (has neighbors)
-        any_can_redistribute = any(degrees[s.id] > 0 for s in switches)
-        
-        if not any_can_redistribute:
-            # No switches can redistribute - PAUSE and show failure dialog
-            for s in switches_over:
-                s.over_threshold = True
-            self.simulation_paused = True
-            self.show_failure_dialog(switches_over)
-            return
-        
-        # Try to redistribute (max 4 iterations)
-        iteration = 0
-        max_iterations = 4
-        
-        while iteration < max_iterations:
-            iteration += 1
-            
-            # Find current switches over threshold
-            switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-            
-            if not switches_over:
-                # SUCCESS: All switches are now below threshold
-                for s in switches:
-                    s.over_threshold = False
-                
-                # Reduce threshold for next redistribution
-                old_threshold = self.load_threshold
-                self.load_threshold = max(self.dynamic_threshold_minimum, 
-                                         self.load_threshold - self.dynamic_threshold_reduction)
-                
-                print(f"[THRESHOLD] Reduced from {old_threshold:.1f} to {self.load_threshold:.1f} (early success)")
-                
-                # Update the spinbox to show new threshold
-                self.threshold_spinbox.blockSignals(True)
-                self.threshold_spinbox.setValue(int(self.load_threshold))
-                self.threshold_spinbox.blockSignals(False)
-                
-                # Log success
-                self.redistribution_log.append((
-                    self.simulation_time,
-                    f"Redistribution successful (dynamic load-sensitive). New threshold: {self.load_threshold:.1f}"
-                ))
-                
-                return  # No pause needed
-            
-            # Filter switches with neighbors that can redistribute
-            eligible_switches = [s for s in switches if degrees[s.id] > 0]
-            eligible_switches.sort(key=lambda s: s.current_load, reverse=True)  # Highest load first
-            
-            # Select top K switches with highest load (load-sensitive)
-            top_k_switches = eligible_switches[:min(self.top_k, len(eligible_switches))]
-            sources_to_redistribute = [s.id for s in top_k_switches]
-            
-            if not sources_to_redistribute:
-                # No more switches can redistribute - break loop
-                break
-            
-            # Get current loads for redistribution algorithm
-            current_loads = {s.id: s.current_load for s in switches}
-            
-            # Call redistribution algorithm
-            try:
-                loads_after = proportional_redistribute_sources_full(
-                    loads=current_loads.copy(),
-                    degrees=degrees,
-                    sources=sources_to_redistribute,
-                    neighbors_map=neighbors_map,
-                    beta=1.0
-                )
-            except Exception as e:
-                print(f"[Error] Redistribution failed: {e}")
-                return
-            
-            # Apply the redistributed loads to switches
-            for switch in switches:
-                if switch.id in loads_after:
-                    new_load = loads_after[switch.id]
-                    switch.current_load = new_load
-                    
-                    # Update cumulative_request_load to match the new load
-                    base_load = 0
-                    for neighbor_id in switch.connections:
-                        neighbor = self.components.get(neighbor_id)
-                        if neighbor:
-                            if neighbor.type == ComponentType.SERVER:
-                                base_load += 20
-                            elif neighbor.type == ComponentType.SWITCH:
-                                base_load += 5
-                            elif neighbor.type == ComponentType.SAN:
-                                base_load += 10
-                    
-                    switch.cumulative_request_load = max(0, new_load - base_load)
-                    
-                    # Recalculate reliability with new load
-                    switch.reliability = reliability_R(
-                        switch.operational_time,
-                        switch.current_load,
-                        switch.base_lambda,
-                        switch.alpha
-                    )
-            
-            # Log this iteration
-            self.redistribution_log.append((
-                self.simulation_time,
-                f"Redistribution iteration {iteration} (dynamic load-sensitive)."
-            ))
-        
-        # After loop: check if all are below threshold
-        switches_still_over = [s for s in switches if s.current_load >= self.load_threshold]
-        
-        # Mark switches as over_threshold
-        for s in switches:
-            s.over_threshold = (s.current_load >= self.load_threshold)
-        
-        if not switches_still_over:
-            # SUCCESS: All switches are below threshold after loop iterations
-            # Reduce threshold only once after successful redistribution
-            old_threshold = self.load_threshold
-            self.load_threshold = max(self.dynamic_threshold_minimum, 
-                                     self.load_threshold - self.dynamic_threshold_reduction)
-            
-            print(f"[THRESHOLD] Reduced from {old_threshold:.1f} to {self.load_threshold:.1f} (after loop)")
-            
-            # Update the spinbox to show new threshold
-            self.threshold_spinbox.blockSignals(True)
-            self.threshold_spinbox.setValue(int(self.load_threshold))
-            self.threshold_spinbox.blockSignals(False)
-            
-            # Log success
-            self.redistribution_log.append((
-                self.simulation_time,
-                f"Redistribution successful (dynamic load-sensitive). New threshold: {self.load_threshold:.1f}"
-            ))
-        else:
-            # FAILURE: Still above threshold after 4 iterations - PAUSE and show failure dialog
-            self.simulation_paused = True
-            self.show_failure_dialog(switches_still_over)
+        self._apply_redistribution('current_load', descending=True, dynamic=True, log_label="dynamic load-sensitive")
     
     def apply_latency_aware_redistribution(self):
         """Apply latency-aware load redistribution prioritizing low-latency neighbors."""
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
+        topo = self._switch_topology()
+        switches = topo.switches
 
         # Identify switches that breach the threshold
-        switches_over = [s for s in switches if s.current_load >= self.load_threshold]
+        switches_over = self._switches_over(topo)
 
         if not switches_over:
             for s in switches:
                 s.over_threshold = False
             return
 
-        # Build neighbor map limited to switch-to-switch links
-        neighbors_map = {}
-        for switch in switches:
-            neighbors_map[switch.id] = [neighbor_id for neighbor_id in switch.connections
-                                        if self.components.get(neighbor_id) and
-                                        self.components[neighbor_id].type == ComponentType.SWITCH]
+        # Neighbor map limited to switch-to-switch links (cached with the topology)
+        neighbors_map = topo.neighbors_map
 
-        # Pre-compute latency ordering for each switch
+        # Pre-compute the closest neighbors of each switch, by latency (only the first
+        # max(1, latency_neighbor_limit) are ever read)
+        closest = max(1, self.latency_neighbor_limit)
         latency_map: Dict[str, List[Tuple[str, float]]] = {}
         for switch in switches:
             latencies = []
@@ -1367,8 +1923,7 @@ class NetworkSimulator(QMainWindow):
                 if neighbor:
                     latency_ms = self.calculate_latency_ms(switch, neighbor)
                     latencies.append((neighbor_id, latency_ms))
-            latencies.sort(key=lambda item: item[1])
-            latency_map[switch.id] = latencies
+            latency_map[switch.id] = heapq.nsmallest(closest, latencies, key=lambda item: item[1])
 
         # Build latency-aware neighbor map (limit to closest neighbors)
         latency_neighbors_map: Dict[str, List[str]] = {}
@@ -1377,6 +1932,7 @@ class NetworkSimulator(QMainWindow):
             latency_neighbors_map[switch.id] = best_neighbors
 
         degrees = {s.id: len(latency_neighbors_map[s.id]) for s in switches}
+        latency_state = SwitchState.from_dicts(dict.fromkeys(latency_neighbors_map, 0.0), degrees, latency_neighbors_map)
 
         if not any(degrees[s.id] > 0 for s in switches_over):
             for s in switches_over:
@@ -1391,106 +1947,75 @@ class NetworkSimulator(QMainWindow):
         last_latency_summary: List[Tuple[str, str, float]] = []
 
         def average_latency_for_switch(switch: NetworkComponent) -> float:
-            lat_list = [lat for _, lat in latency_map.get(switch.id, [])[:max(1, self.latency_neighbor_limit)]]
+            lat_list = [lat for _, lat in latency_map.get(switch.id, [])]
             return sum(lat_list) / len(lat_list) if lat_list else float('inf')
 
-        while iteration < max_iterations:
-            iteration += 1
-
-            switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-
-            if not switches_over:
-                for s in switches:
-                    s.over_threshold = False
-                if last_selected_sources:
-                    avg_latency = (sum(lat for _, _, lat in last_latency_summary) / len(last_latency_summary)
-                                   if last_latency_summary else 0.0)
-                    self.redistribution_log.append((
-                        self.simulation_time,
-                        f"Latency-Aware Redistribution: sources {', '.join(last_selected_sources)} (avg latency {avg_latency:.2f} ms)"
-                    ))
-                else:
-                    self.redistribution_log.append((
-                        self.simulation_time,
-                        "Latency-Aware Redistribution: threshold satisfied"
-                    ))
-                return
-
-            eligible_switches = [s for s in switches_over if degrees[s.id] > 0]
+        with self._deferred_reliability(topo):
+            while iteration < max_iterations:
+                iteration += 1
 
-            if not eligible_switches:
-                break
+                switches_over = self._switches_over(topo)
 
-            eligible_switches.sort(
-                key=lambda s: (-(s.current_load - self.load_threshold), average_latency_for_switch(s))
-            )
+                if not switches_over:
+                    for s in switches:
+                        s.over_threshold = False
+                    if last_selected_sources:
+                        avg_latency = (sum(lat for _, _, lat in last_latency_summary) / len(last_latency_summary)
+                                       if last_latency_summary else 0.0)
+                        self.redistribution_log.append((
+                            self.simulation_time,
+                            f"Latency-Aware Redistribution: sources {', '.join(last_selected_sources)} (avg latency {avg_latency:.2f} ms)"
+                        ))
+                    else:
+                        self.redistribution_log.append((
+                            self.simulation_time,
+                            "Latency-Aware Redistribution: threshold satisfied"
+                        ))
+                    return
 
-            top_k_switches = eligible_switches[:min(self.top_k, len(eligible_switches))]
-            sources_to_redistribute = [s.id for s in top_k_switches]
+                eligible_switches = [s for s in switches_over if degrees[s.id] > 0]
 
-            if not sources_to_redistribute:
-                break
+                if not eligible_switches:
+                    break
 
-            latency_summary = []
-            for switch in top_k_switches:
-                best_neighbors = latency_neighbors_map.get(switch.id, [])
-                if not best_neighbors:
-                    continue
-                best_neighbor_id = best_neighbors[0]
-                neighbor_latency = next((lat for neighbor_id, lat in latency_map[switch.id]
-                                         if neighbor_id == best_neighbor_id), None)
-                if neighbor_latency is not None:
-                    latency_summary.append((switch.id, best_neighbor_id, neighbor_latency))
+                top_k_switches = heapq.nsmallest(
+                    self.top_k, eligible_switches,
+                    key=lambda s: (-(s.current_load - self.load_threshold), average_latency_for_switch(s))
+                )
+                sources_to_redistribute = [s.id for s in top_k_switches]
 
-            current_loads = {s.id: s.current_load for s in switches}
+                if not sources_to_redistribute:
+                    break
 
-            try:
-                loads_after = proportional_redistribute_sources_full(
-                    loads=current_loads.copy(),
-                    degrees=degrees,
-                    sources=sources_to_redistribute,
-                    neighbors_map=latency_neighbors_map,
-                    beta=1.0
-                )
-            except Exception as e:
-                print(f"[Error] Latency-aware redistribution failed: {e}")
-                return
+                latency_summary = []
+                for switch in top_k_switches:
+                    best_neighbors = latency_neighbors_map.get(switch.id, [])
+                    if not best_neighbors:
+                        continue
+                    best_neighbor_id = best_neighbors[0]
+                    neighbor_latency = next((lat for neighbor_id, lat in latency_map[switch.id]
+                                             if neighbor_id == best_neighbor_id), None)
+                    if neighbor_latency is not None:
+                        latency_summary.append((switch.id, best_neighbor_id, neighbor_latency))
 
-            for switch in switches:
-                if switch.id in loads_after:
-                    new_load = loads_after[switch.id]
-                    switch.current_load = new_load
-
-                    base_load = 0
-                    for neighbor_id in switch.connections:
-                        neighbor = self.components.get(neighbor_id)
-                        if neighbor:
-                            if neighbor.type == ComponentType.SERVER:
-                                base_load += 20
-                            elif neighbor.type == ComponentType.SWITCH:
-                                base_load += 5
-                            elif neighbor.type == ComponentType.SAN:
-                                base_load += 10
-
-                    switch.cumulative_request_load = max(0, new_load - base_load)
-
-                    switch.reliability = reliability_R(
-                        switch.operational_time,
-                        switch.current_load,
-                        switch.base_lambda,
-                        switch.alpha
-                    )
+                try:
+                    loads_after = self._redistribute_sources(topo, sources_to_redistribute, latency_state)
+                except Exception as e:
+                    print(f"[Error] Latency-aware redistribution failed: {e}")
+                    return
 
+                for switch in self._apply_redistributed_loads(topo, loads_after, refresh_reliability=False):
                     switch.sleep_mode = False
                     switch.calculate_power_consumption()
 
-            last_selected_sources = sources_to_redistribute
-            last_latency_summary = latency_summary
+                last_selected_sources = sources_to_redistribute
+                last_latency_summary = latency_summary
 
-        switches_still_over = [s for s in switches if s.current_load >= self.load_threshold]
+        switches_still_over = self._switches_over(topo)
 
+        still_over_ids = {s.id for s in switches_still_over}
         for s in switches:
-            s.over_threshold = (s.current_load >= self.load_threshold)
+            s.over_threshold = s.id in still_over_ids
 
         if switches_still_over:
             self.simulation_paused = True
@@ -1507,10 +2032,11 @@ class NetworkSimulator(QMainWindow):
         - Can put switches to sleep if load < 10 (power -> 0, unavailable)
         - Considers power efficiency: prefer high-capacity neighbors
         """
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
+        topo = self._switch_topology()
+        switches = topo.switches
         
         # Find switches over threshold
-        switches_over = [s for s in switches if s.current_load >= self.load_threshold]
+        switches_over = self._switches_over(topo)
         
         if not switches_over:
             # Clear over_threshold flag for all if none are over
@@ -1518,18 +2044,11 @@ class NetworkSimulator(QMainWindow):
                 s.over_threshold = False
             return  # No redistribution needed
         
-        # Build neighbors map from actual network connections
-        neighbors_map = {}
-        for switch in switches:
-            neighbors_map[switch.id] = [neighbor_id for neighbor_id in switch.connections 
-                                        if self.components.get(neighbor_id) and 
-                                        self.components[neighbor_id].type == ComponentType.SWITCH]
-        
-        # Build degrees dictionary (number of connected switches)
-        degrees = {s.id: len(neighbors_map[s.id]) for s in switches}
+        # Switch-to-switch degrees (cached with the topology)
+        degrees = topo.degrees
         
         # Check if ANY switch can actually redistribute (has neighbors)
-        any_can_redistribute = any(degrees[s.id] > 0 for s in switches)
+        any_can_redistribute = topo.any_can_redistribute
         
         if not any_can_redistribute:
             # No switches can redistribute - mark over-threshold
@@ -1546,99 +2065,66 @@ class NetworkSimulator(QMainWindow):
         iteration = 0
         max_iterations = 4
         
-        while iteration < max_iterations:
-            iteration += 1
-            
-            # Find current switches over threshold
-            switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-            
-            if not switches_over:
-                # SUCCESS: All switches are now below threshold
-                for s in switches:
-                    s.over_threshold = False
+        with self._deferred_reliability(topo):
+            while iteration < max_iterations:
+                iteration += 1
                 
-                # Log energy savings
-                power_after = sum(s.power_consumption for s in switches)
-                savings = power_before - power_after
-                self.redistribution_log.append((
-                    self.simulation_time,
-                    f"Energy-Aware Redistribution: Saved {savings:.1f}W (before: {power_before:.1f}W, after: {power_after:.1f}W)"
-                ))
-                return  # No pause needed
-            
-            # Filter switches with neighbors that can redistribute
-            # Energy-aware: prefer switches consuming MORE power to reduce overall consumption
-            eligible_switches = [s for s in switches if degrees[s.id] > 0]
-            eligible_switches.sort(key=lambda s: s.power_consumption, reverse=True)  # Highest power first
-            
-            # Select top K switches with highest power consumption
-            top_k_switches = eligible_switches[:min(self.top_k, len(eligible_switches))]
-            sources_to_redistribute = [s.id for s in top_k_switches]
-            
-            if not sources_to_redistribute:
-                # No more switches can redistribute - break loop
-                break
-            
-            # Get current loads for redistribution algorithm
-            current_loads = {s.id: s.current_load for s in switches}
-            
-            # Call redistribution algorithm
-            try:
-                loads_after = proportional_redistribute_sources_full(
-                    loads=current_loads.copy(),
-                    degrees=degrees,
-                    sources=sources_to_redistribute,
-                    neighbors_map=neighbors_map,
-                    beta=1.0
-                )
-            except Exception as e:
-                print(f"[Error] Energy-aware redistribution failed: {e}")
-                return
-            
-            # Apply the redistributed loads to switches
-            for switch in switches:
-                if switch.id in loads_after:
-                    new_load = loads_after[switch.id]
-                    switch.current_load = new_load
-                    
-                    # Update cumulative_request_load to match the new load
-                    base_load = 0
-                    for neighbor_id in switch.connections:
-                        neighbor = self.components.get(neighbor_id)
-                        if neighbor:
-                            if neighbor.type == ComponentType.SERVER:
-                                base_load += 20
-                            elif neighbor.type == ComponentType.SWITCH:
-                                base_load += 5
-                            elif neighbor.type == ComponentType.SAN:
-                                base_load += 10
-                    
-                    switch.cumulative_request_load = max(0, new_load - base_load)
-                    
-                    # Recalculate reliability with new load
-                    switch.reliability = reliability_R(
-                        switch.operational_time,
-                        switch.current_load,
-                        switch.base_lambda,
-                        switch.alpha
-                    )
+                # Find current switches over threshold
+                switches_over = self._switches_over(topo)
+                
+                if not switches_over:
+                    # SUCCESS: All switches are now below threshold
+                    for s in switches:
+                        s.over_threshold = False
                     
+                    # Log energy savings
+                    power_after = sum(s.power_consumption for s in switches)
+                    savings = power_before - power_after
+                    self.redistribution_log.append((
+                        self.simulation_time,
+                        f"Energy-Aware Redistribution: Saved {savings:.1f}W (before: {power_before:.1f}W, after: {power_after:.1f}W)"
+                    ))
+                    return  # No pause needed
+                
+                # Filter switches with neighbors that can redistribute
+                # Energy-aware: prefer switches consuming MORE power to reduce overall consumption
+                eligible_switches = [s for s in switches if degrees[s.id] > 0]
+                
+                # Select top K switches with highest power consumption
+                top_k_switches = self._top_k_switches(eligible_switches, 'power_consumption', descending=True)  # Highest power first
+                sources_to_redistribute = [s.id for s in top_k_switches]
+                
+                if not sources_to_redistribute:
+                    # No more switches can redistribute - break loop
+                    break
+                
+                # Call redistribution algorithm
+                try:
+                    loads_after = self._redistribute_sources(topo, sources_to_redistribute)
+                except Exception as e:
+                    print(f"[Error] Energy-aware redistribution failed: {e}")
+                    return
+                
+                # Apply the redistributed loads to switches
+                for switch in self._apply_redistributed_loads(topo, loads_after, refresh_reliability=False):
                     # Recalculate power consumption with new load
                     switch.calculate_power_consumption()
                     
                     # Try to sleep switches with very low load (< 10)
                     if switch.current_load < 10 and switch.id not in sources_to_redistribute:
                         switch.sleep_mode = True
-                        print(f"[DEBUG] Switch {switch.id} entering sleep mode (load: {switch.current_load:.1f})")
+                        if self._debug:
+                            print(f"[DEBUG] Switch {switch.id} entering sleep mode (load: {switch.current_load:.1f})")
                     else:
                         switch.sleep_mode = False
         
         # After loop: check if all are below threshold
-        switches_still_over = [s for s in switches if s.current_load >= self.load_threshold]
+        switches_still_over = self._switches_over(topo)
         
         # Mark switches as over_threshold
+        still_over_ids = {s.id for s in switches_still_over}
         for s in switches:
-            s.over_threshold = (s.current_load >= self.load_threshold)
+            s.over_threshold = s.id in still_over_ids
         
         if switches_still_over:
             # FAILURE: Still above threshold after 4 iterations - PAUSE and show failure dialog
@@ -1666,259 +2152,21 @@ class NetworkSimulator(QMainWindow):
     def apply_dynamic_threshold_reliability_sensitive_redistribution(self):
         """Apply dynamic threshold reliability-sensitive load redistribution.
         
-        Similar to static threshold, but after successful redistribution, 
-        the threshold is reduced by dynamic_threshold_reduction amount.
-        Selects switches with LOWEST reliability to redistribute.
-        
-        Logic:
-        - If load >= threshold: try redistribution (max 4 iterations)
-          - Select top K switches with LOWEST reliability that have neighbors
-          - If all below threshold after redistribution: 
-            - Log success
-            - Reduce threshold by dynamic_threshold_reduction (min: dynamic_threshold_minimum)
-            - Continue simulation (no pause)
-          - If still above after 4 iterations: show failure dialog and PAUSE
+        Similar to static threshold, but after successful redistribution the threshold is reduced
+        by dynamic_threshold_reduction. Selects switches with LOWEST reliability to redistribute;
+        see `_apply_redistribution`.
         """
-        print(f"[DEBUG] apply_dynamic_threshold_reliability_sensitive_redistribution called with threshold={self.load_threshold:.1f}")
-        
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
-        
-        # Find switches over threshold
-        switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-        
-        if not switches_over:
-            # Clear over_threshold flag for all if none are over
-            for s in switches:
-                s.over_threshold = False
-            return  # No redistribution needed
-        
-        # Build neighbors map from actual network connections
-        neighbors_map = {}
-        for switch in switches:
-            neighbors_map[switch.id] = [neighbor_id for neighbor_id in switch.connections 
-                                        if self.components.get(neighbor_id) and 
-                                        self.components[neighbor_id].type == ComponentType.SWITCH]
-        
-        # Build degrees dictionary (number of connected switches)
-        degrees = {s.id: len(neighbors_map[s.id]) for s in switches}
-        
-        # Check if ANY switch can actually redistribute (has neighbors)
-        any_can_redistribute = any(degrees[s.id] > 0 for s in switches)
-        
-        if not any_can_redistribute:
-            # No switches can redistribute - PAUSE and show failure dialog
-            for s in switches_over:
-                s.over_threshold = True
-            self.simulation_paused = True
-            self.show_failure_dialog(switches_over)
-            return
-        
-        # Try to redistribute (max 4 iterations)
-        iteration = 0
-        max_iterations = 4
-        
-        while iteration < max_iterations:
-            iteration += 1
-            
-            # Find current switches over threshold
-            switches_over = [s for s in switches if s.current_load >= self.load_threshold]
-            
-            if not switches_over:
-                # SUCCESS: All switches are now below threshold
-                for s in switches:
-                    s.over_threshold = False
-                
-                # Reduce threshold for next redistribution
-                old_threshold = self.load_threshold
-                self.load_threshold = max(self.dynamic_threshold_minimum, 
-                                         self.load_threshold - self.dynamic_threshold_reduction)
-                
-                print(f"[THRESHOLD] Reduced from {old_threshold:.1f} to {self.load_threshold:.1f} (early success)")
-                
-                # Update the spinbox to show new threshold
-                self.threshold_spinbox.blockSignals(True)
-                self.threshold_spinbox.setValue(int(self.load_threshold))
-                self.threshold_spinbox.blockSignals(False)
-                
-                # Log success
-                self.redistribution_log.append((
-                    self.simulation_time,
-                    f"Redistribution successful (dynamic reliability-sensitive). New threshold: {self.load_threshold:.1f}"
-                ))
-                
-                return  # No pause needed
-            
-            # Filter switches with neighbors that can redistribute
-            eligible_switches = [s for s in switches if degrees[s.id] > 0]
-            eligible_switches.sort(key=lambda s: s.reliability)  # Lowest reliability first
-            
-            # Select top K switches with lowest reliability (reliability-sensitive)
-            top_k_switches = eligible_switches[:min(self.top_k, len(eligible_switches))]
-            sources_to_redistribute = [s.id for s in top_k_switches]
-            
-            if not sources_to_redistribute:
-                # No more switches can redistribute - break loop
-                break
-            
-            # Get current loads for redistribution algorithm
-            current_loads = {s.id: s.current_load for s in switches}
-            
-            # Call redistribution algorithm
-            try:
-                loads_after = proportional_redistribute_sources_full(
-                    loads=current_loads.copy(),
-                    degrees=degrees,
-                    sources=sources_to_redistribute,
-                    neighbors_map=neighbors_map,
-                    beta=1.0
-                )
-            except Exception as e:
-                print(f"[Error] Redistribution failed: {e}")
-                return
-            
-            # Apply the redistributed loads to switches
-            for switch in switches:
-                if switch.id in loads_after:
-                    new_load = loads_after[switch.id]
-                    switch.current_load = new_load
-                    
-                    # Update cumulative_request_load to match the new load
-                    base_load = 0
-                    for neighbor_id in switch.connections:
-                        neighbor = self.components.get(neighbor_id)
-                        if neighbor:
-                            if neighbor.type == ComponentType.SERVER:
-                                base_load += 20
-                            elif neighbor.type == ComponentType.SWITCH:
-                                base_load += 5
-                            elif neighbor.type == ComponentType.SAN:
-                                base_load += 10
-                    
-                    switch.cumulative_request_load = max(0, new_load - base_load)
-                    
-                    # Recalculate reliability with new load
-                    switch.reliability = reliability_R(
-                        switch.operational_time,
-                        switch.current_load,
-                        switch.base_lambda,
-                        switch.alpha
-                    )
-            
-            # Log this iteration
-            self.redistribution_log.append((
-                self.simulation_time,
-                f"Redistribution iteration {iteration} (dynamic reliability-sensitive)."
-            ))
-        
-        # After loop: check if all are below threshold
-        switches_still_over = [s for s in switches if s.current_load >= self.load_threshold]
-        
-        # Mark switches as over_threshold
-        for s in switches:
-            s.over_threshold = (s.current_load >= self.load_threshold)
-        
-        if not switches_still_over:
-            # SUCCESS: All switches are below threshold after loop iterations
-            # Reduce threshold only once after successful redistribution
-            old_threshold = self.load_threshold
-            self.load_threshold = max(self.dynamic_threshold_minimum, 
-                                     self.load_threshold - self.dynamic_threshold_reduction)
-            
-            print(f"[THRESHOLD] Reduced from {old_threshold:.1f} to {self.load_threshold:.1f} (after loop)")
-            
-            # Update the spinbox to show new threshold
-            self.threshold_spinbox.blockSignals(True)
-            self.threshold_spinbox.setValue(int(self.load_threshold))
-            self.threshold_spinbox.blockSignals(False)
-            
-            # Log success
-            self.redistribution_log.append((
-                self.simulation_time,
-                f"Redistribution successful (dynamic reliability-sensitive). New threshold: {self.load_threshold:.1f}"
-            ))
-        else:
-            # FAILURE: Still above threshold after 4 iterations - PAUSE and show failure dialog
-            self.simulation_paused = True
-            self.show_failure_dialog(switches_still_over)
+        self._apply_redistribution('reliability', dynamic=True, log_label="dynamic reliability-sensitive")
     
     def update_statistics(self):
-        """Update statistics table - switches only."""
+        """Update switch power, history and colors; the stats table follows within a second."""
         # Get all switches
-        switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
+        switches = self.switches
         
         # Calculate power for all switches
-        for switch in switches:
-            switch.calculate_power_consumption()
+        NetworkComponent.table.update_power(self._switch_topology().rows)
         
-        # Ensure table has the right number of rows
-        if self.stats_table.rowCount() != len(switches):
-            self.stats_table.blockSignals(True)
-            self.stats_table.setRowCount(len(switches))
-            
-            for row, switch in enumerate(switches):
-                # Switch ID (not editable)
-                id_item = QTableWidgetItem(switch.id)
-                id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 0, id_item)
-                
-                # Req/s: editable for user to pause and adjust
-                req_item = QTableWidgetItem(str(int(switch.incoming_requests)))
-                req_item.setFlags(req_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 3, req_item)
-                
-                # Lambda: editable
-                lambda_item = QTableWidgetItem(f"{switch.base_lambda:.2e}")
-                lambda_item.setFlags(lambda_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 5, lambda_item)
-                
-                # Alpha: editable
-                alpha_item = QTableWidgetItem(str(switch.alpha))
-                alpha_item.setFlags(alpha_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 6, alpha_item)
-            
-            self.stats_table.blockSignals(False)
-        
-        # Update Load, Power, Reliability, and Op.Time on every frame
-        for row, switch in enumerate(switches):
-            # Load (update only) - just the numeric value
-            load_text = f"{switch.current_load:.1f}"
-            load_item = self.stats_table.item(row, 1)
-            if load_item is None:
-                load_item = QTableWidgetItem(load_text)
-                load_item.setFlags(load_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 1, load_item)
-            else:
-                load_item.setText(load_text)
-            
-            # Power Consumption (update only) - Energy-aware feature
-            power_text = f"{switch.power_consumption:.1f}"
-            power_item = self.stats_table.item(row, 2)
-            if power_item is None:
-                power_item = QTableWidgetItem(power_text)
-                power_item.setFlags(power_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 2, power_item)
-            else:
-                power_item.setText(power_text)
-            
-            # Reliability (update only) - AFTM-based reliability
-            reliability_text = f"{switch.reliability:.4f}"
-            reliability_item = self.stats_table.item(row, 4)
-            if reliability_item is None:
-                reliability_item = QTableWidgetItem(reliability_text)
-                reliability_item.setFlags(reliability_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 4, reliability_item)
-            else:
-                reliability_item.setText(reliability_text)
-            
-            # Operational Time (update only)
-            op_time_text = f"{switch.operational_time:.1f}s"
-            op_time_item = self.stats_table.item(row, 7)
-            if op_time_item is None:
-                op_time_item = QTableWidgetItem(op_time_text)
-                op_time_item.setFlags(op_time_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.stats_table.setItem(row, 7, op_time_item)
-            else:
-                op_time_item.setText(op_time_text)
+        self._stats_dirty = True
         
         # Log current loads for graph generation (only during simulation, every 5 seconds)
         if self.simulation_running and not self.simulation_paused:
@@ -1927,59 +2175,26 @@ class NetworkSimulator(QMainWindow):
                 self.log_counter = 0
                 for switch in switches:
                     if switch.id in self.load_history:
-                        self.load_history[switch.id].append((self.simulation_time, switch.current_load))
+                        self.load_history[switch.id].append(self.simulation_time, switch.current_load)
                     # Also log power consumption for energy-aware graphs
                     if switch.id in self.power_history:
-                        self.power_history[switch.id].append((self.simulation_time, switch.power_consumption))
+                        self.power_history[switch.id].append(self.simulation_time, switch.power_consumption)
         
-        # Update graphics for all switches to reflect color changes (over_threshold, load colors)
-        for graphics_item in self.graphics_items.values():
-            if graphics_item.component.type == ComponentType.SWITCH:
-                graphics_item.update()
+        # Repaint switches whose color changed (over_threshold, load colors)
+        graphics_items = self.graphics_items
+        for switch in switches:
+            graphics_items[switch.id].refresh()
     
-    def on_stats_cell_changed(self, row: int, column: int):
-        """Handle edits in the statistics table (Req/s, Lambda, Alpha for switches)."""
-        id_item = self.stats_table.item(row, 0)
-        if id_item is None:
-            return
-        
-        comp_id = id_item.text()
-        comp = self.components.get(comp_id)
-        if comp is None or comp.type != ComponentType.SWITCH:
-            return
-        
-        value_item = self.stats_table.item(row, column)
-        if value_item is None:
-            return
-        
-        try:
-            # Column 3: Req/s (incoming requests)
-            if column == 3:
-                val = float(value_item.text())
-                if val < 0:
-                    val = 0
-                comp.incoming_requests = val
-            
-            # Column 5: Lambda (base failure rate)
-            elif column == 5:
-                val = float(value_item.text())
-                if val < 0:
-                    val = 0
-                comp.base_lambda = val
-            
-            # Column 6: Alpha (load exponent)
-            elif column == 6:
-                val = float(value_item.text())
-                if val < 0:
-                    val = 0
-                comp.alpha = val
-            
-            else:
-                return
-        except Exception:
+    def _flush_stats(self):
+        """Write pending switch stats into the table (runs on stats_timer, at most once per second)."""
+        if not self._stats_dirty:
             return
+        self._stats_dirty = False
         
-        # Recalculate loads and reliability immediately when user edits
+        self.stats_model.refresh(self.switches)
+    
+    def on_stats_edited(self, switch: 'NetworkComponent'):
+        """Recalculate loads and reliability immediately after a Req/s, Lambda or Alpha edit."""
         self.calculate_switch_loads(include_requests=self.simulation_running)
     
     def generate_graph(self, graph_type='load'):
@@ -1989,7 +2204,7 @@ class NetworkSimulator(QMainWindow):
             graph_type: 'load' for load vs time, 'power' for power vs time
         """
         # Get all current switches
-        all_switches = [c for c in self.components.values() if c.type == ComponentType.SWITCH]
+        all_switches = self.switches
         
         if not all_switches:
             QMessageBox.warning(self, "No Data", "No switches in the network")
@@ -2006,41 +2221,64 @@ class NetworkSimulator(QMainWindow):
             title = 'Switch Load vs Time'
         
         # Check if we have any history data
-        has_history = any(history_data.get(s.id, []) for s in all_switches)
+        has_history = any(len(history_data.get(s.id, ())) for s in all_switches)
         
         if not has_history:
             QMessageBox.warning(self, "No Data", f"Run simulation first to generate {graph_type} graph")
             return
         
-        # Create figure
-        plt.figure(figsize=(12, 6))
-        
-        # Plot data for each switch from history
+        # Snapshot the series to plot (the worker must not touch live history)
         colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
-        plotted = False
+        series = []
         
         for i, switch in enumerate(all_switches):
-            data = history_data.get(switch.id, [])
-            if data:  # Plot if there's history data
-                times = [t for t, _ in data]
-                values = [v for _, v in data]
+            data = history_data.get(switch.id)
+            if data is not None and len(data):  # Plot if there's history data
+                times, values = data.arrays()
+                # Long runs are thinned to about MAX_PLOT_POINTS, always keeping the latest point
+                stride = -(-len(times) // self.MAX_PLOT_POINTS)
+                if stride > 1:
+                    keep = np.arange(0, len(times), stride)
+                    if keep[-1] != len(times) - 1:
+                        keep = np.append(keep, len(times) - 1)
+                    times, values = times[keep], values[keep]
                 color = colors[i % len(colors)]
-                plt.plot(times, values, marker='o', label=switch.id, color=color, linewidth=2)
-                plotted = True
+                series.append((switch.id, color, times, values))
         
-        if not plotted:
+        if not series:
             QMessageBox.warning(self, "No Data", f"No {graph_type} history recorded")
             return
         
-        plt.xlabel('Time (steps)', fontsize=12)
-        plt.ylabel(y_label, fontsize=12)
-        plt.title(title, fontsize=14, fontweight='bold')
-        plt.legend(loc='best')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        # Show the plot
-        plt.show()
+        # Render on a worker thread; show_graph displays the image when it is ready
+        thread = QThread(self)
+        worker = PlotWorker(series, y_label, title)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(self.show_graph)
+        # QThread.quit is thread-safe; calling it directly lets closeEvent wait() without the event loop
+        worker.finished.connect(thread.quit, Qt.ConnectionType.DirectConnection)
+        # Once the thread stops, forget the job and delete the thread and worker (the thread is a child
+        # of the window, so dropping the Python references alone would keep it alive)
+        job = (thread, worker)
+        thread.finished.connect(lambda: self._plot_jobs.remove(job))
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._plot_jobs.append(job)
+        thread.start()
+    
+    @pyqtSlot(bytes, str)
+    def show_graph(self, png: bytes, title: str):
+        """Show a graph rendered by PlotWorker."""
+        pixmap = QPixmap()
+        pixmap.loadFromData(png, "PNG")
+        GraphDialog(self, title, pixmap).show()
+    
+    def closeEvent(self, event):
+        # Let graph renders in flight finish before their threads are destroyed
+        for thread, _ in self._plot_jobs:
+            thread.quit()
+            thread.wait()
+        super().closeEvent(event)
     
     def clear_all(self):
         """Clear all components and connections."""
@@ -2048,9 +2286,17 @@ class NetworkSimulator(QMainWindow):
                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
             self.scene.clear()
+            # drop the stats rows first: their switches' table rows are about to be reused
+            self.stats_model.refresh([])
+            # the table is shared by all simulators, so the rows go back to it for reuse
+            NetworkComponent.table.release([c._row for c in self.components.values()])
             self.components.clear()
+            for components in self.components_by_type.values():
+                components.clear()
+            self._topology = None
             self.graphics_items.clear()
             self.connections_graphics.clear()
+            self.edge_index.clear()
     
     def save_configuration(self):
         """Save network configuration to JSON."""
@@ -2059,54 +2305,81 @@ class NetworkSimulator(QMainWindow):
         }
         
         try:
-            with open('network_config.json', 'w') as f:
-                json.dump(config, f, indent=2)
-            QMessageBox.information(self, "Saved", "Configuration saved to network_config.json")
+            if orjson is not None:
+                # NumPy scalars/arrays from the component table serialize natively
+                with open('network_config.json', 'wb') as f:
+                    f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open('network_config.json', 'w') as f:
+                    json.dump(config, f, indent=2)
+            self.statusBar().showMessage("Configuration saved to network_config.json", 2000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save: {str(e)}")
     
+    def _bulk_add(self, components_json: List[Dict]):
+        """Add saved components and their connections to the scene as one batch.
+        
+        Viewport updates are switched off while items are added, and switch loads and statistics
+        are recomputed once when the batch ends.
+        """
+        with self._batch():
+            self.view.setUpdatesEnabled(False)
+            try:
+                # Load components; connections are wired once every endpoint exists
+                pending_connections = []
+                for comp_data in components_json:
+                    comp_type = ComponentType(comp_data['type'])
+                    component = NetworkComponent.create(comp_type, comp_data['x'], comp_data['y'])
+                    component.id = comp_data['id']
+                    # Restore incoming requests if present
+                    component.incoming_requests = comp_data.get('incoming_requests', 0)
+                    # Restore cumulative request load if present
+                    component.cumulative_request_load = comp_data.get('cumulative_request_load', 0.0)
+                    # Restore AFTM parameters if present
+                    component.operational_time = comp_data.get('operational_time', 0.0)
+                    component.base_lambda = comp_data.get('base_lambda', 3e-6)
+                    component.alpha = comp_data.get('alpha', 1.0)
+                    self._register_component(component)
+                    
+                    graphics_item = GraphicsNetworkComponent(component)
+                    self.graphics_items[component.id] = graphics_item
+                    self.scene.addItem(graphics_item)
+                    pending_connections.append((component.id, comp_data['connections']))
+                
+                # Restore connections
+                for source_id, dest_ids in pending_connections:
+                    source = self.components[source_id]
+                    for dest_id in dest_ids:
+                        source.connect_to(dest_id)
+                        
+                        # Add graphics connections
+                        if source.id in self.graphics_items and dest_id in self.graphics_items:
+                            conn = GraphicsConnection(self.graphics_items[source.id], 
+                                                    self.graphics_items[dest_id],
+                                                    self.latency_conversion_factor)
+                            self._add_connection_item(conn)
+            finally:
+                self._topology = None
+                self.view.setUpdatesEnabled(True)
+                self.scene.update()
+            
+            self._schedule_recalc()
+    
     def load_configuration(self):
         """Load network configuration from JSON."""
         try:
-            with open('network_config.json', 'r') as f:
-                config = json.load(f)
+            if orjson is not None:
+                with open('network_config.json', 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open('network_config.json', 'r') as f:
+                    config = json.load(f)
             
             self.clear_all()
             
-            # Load components
-            for comp_data in config['components']:
-                comp_type = ComponentType(comp_data['type'])
-                component = NetworkComponent(comp_type, comp_data['x'], comp_data['y'])
-                component.id = comp_data['id']
-                # Restore incoming requests if present
-                component.incoming_requests = comp_data.get('incoming_requests', 0)
-                # Restore cumulative request load if present
-                component.cumulative_request_load = comp_data.get('cumulative_request_load', 0.0)
-                # Restore AFTM parameters if present
-                component.operational_time = comp_data.get('operational_time', 0.0)
-                component.base_lambda = comp_data.get('base_lambda', 3e-6)
-                component.alpha = comp_data.get('alpha', 1.0)
-                self.components[component.id] = component
-                
-                graphics_item = GraphicsNetworkComponent(component)
-                self.graphics_items[component.id] = graphics_item
-                self.scene.addItem(graphics_item)
-            
-            # Restore connections
-            for comp_data in config['components']:
-                source = self.components[comp_data['id']]
-                for dest_id in comp_data['connections']:
-                    source.connect_to(dest_id)
-                    
-                    # Add graphics connections
-                    if source.id in self.graphics_items and dest_id in self.graphics_items:
-                        conn = GraphicsConnection(self.graphics_items[source.id], 
-                                                self.graphics_items[dest_id],
-                                                self.latency_conversion_factor)
-                        self.connections_graphics.append(conn)
-                        self.scene.addItem(conn)
+            self._bulk_add(config['components'])
             
-            QMessageBox.information(self, "Loaded", "Configuration loaded successfully")
+            self.statusBar().showMessage("Configuration loaded successfully", 2000)
         except FileNotFoundError:
             QMessageBox.warning(self, "Error", "Configuration file not found")
         except Exception as e:
@@ -0,0 +1,242 @@
+"""
+Per-tick numeric kernel of the network simulator
+
+One call advances every switch by `dt` seconds over the ComponentTable columns:
+  cumulative_request_load += incoming_requests * endpoints * 0.1
+  operational_time       += dt
+  current_load            = max(0, base_load + cumulative_request_load)
+  load_pct                = current_load / bandwidth_capacity * 100   (0 without capacity)
+  reliability             = exp(-base_lambda * current_load^alpha * operational_time)   (AFTM)
+and writes the over-threshold mask (current_load >= threshold) aligned with `rows` into `over`,
+a caller-owned buffer that is also returned, so a tick allocates no arrays.
+
+`rows` selects the switch rows of the table; `base_load` and `endpoints` are aligned with
+`rows` (see SwitchTopology). Arrays are updated in place, in a single pass per switch.
+`update_reliability` recomputes only the reliability column, for rows whose load was
+changed outside the tick (redistribution, reset, topology edits).
+`redistribution_loop` runs the iterations of the threshold redistribution strategies in one
+call (numba only; it is None without numba and the simulator loops in Python instead).
+Compiled with numba when it is installed, otherwise the same arithmetic runs as NumPy
+array ops. Switches are independent within a tick, so from PARALLEL_MIN_ROWS switches on the
+numba loop is spread over threads with prange.
+"""
+import math
+
+import numpy as np
+
+from aftm_model import reliability_R
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Below this many switches thread start-up costs more than the loop itself
+PARALLEL_MIN_ROWS = 4096
+
+
+def _step_loop(rows, base_load, endpoints, incoming_requests, cumulative_request_load,
+               operational_time, current_load, bandwidth_capacity, load_pct, reliability,
+               base_lambda, alpha, dt, threshold, over):
+    # each iteration writes only row rows[i] and over[i] (rows are distinct)
+    for i in prange(rows.shape[0]):
+        r = rows[i]
+        cumulative_request_load[r] += incoming_requests[r] * endpoints[i] * 0.1
+        operational_time[r] += dt
+
+        load = base_load[i] + cumulative_request_load[r]
+        if load < 0.0:
+            load = 0.0
+        current_load[r] = load
+
+        cap = bandwidth_capacity[r]
+        load_pct[r] = (load / cap) * 100 if cap > 0 else 0.0
+        reliability[r] = math.exp(-(base_lambda[r] * load ** alpha[r]) * operational_time[r])
+        over[i] = load >= threshold
+    return over
+
+
+def _reliability_loop(rows, operational_time, current_load, base_lambda, alpha, reliability):
+    for i in prange(rows.shape[0]):
+        r = rows[i]
+        reliability[r] = math.exp(-(base_lambda[r] * current_load[r] ** alpha[r]) * operational_time[r])
+
+
+def _top_k_loop(keys, k):
+    """Indices of the `k` smallest `keys`, smallest first with equal keys in index order
+    (network_simulator.top_k_order): partition in O(n), then sort only the selected."""
+    if k >= keys.shape[0]:
+        return np.argsort(keys, kind='mergesort')
+    kth = np.partition(keys, k - 1)[k - 1]
+    better = np.flatnonzero(keys < kth)
+    ties = np.flatnonzero(keys == kth)[:k - better.shape[0]]
+    sel = np.concatenate((better, ties))
+    return sel[np.argsort(keys[sel], kind='mergesort')]
+
+
+def _redistribution_loop(rows, base_load, eligible, nk_offsets, nk_indices, deg_pow,
+                         current_load, cumulative_request_load, bandwidth_capacity, load_pct,
+                         operational_time, base_lambda, alpha, reliability,
+                         by_reliability, top_k, threshold, max_iterations, loads, over):
+    """Up to `max_iterations` rounds of: stop if no switch is over `threshold`, otherwise move the
+    full load of the `top_k` eligible switches (lowest reliability, or highest load) over their N_k.
+    A round that changes no load ends the loop, since every later round would repeat it.
+
+    Positions i index `rows`, `base_load`, `loads`, `over` and the N_k CSR; the redistribution is
+    `load_redistribution.redistribute_sources_arrays` and the write-back matches the simulator's.
+    Returns (last iteration, redistributions applied, success); `over` holds the last mask.
+    """
+    n = rows.shape[0]
+    iteration = 0
+    redistributed = 0
+    success = False
+    keys = np.empty(eligible.shape[0], dtype=np.float64)
+    delta = np.empty(n, dtype=np.float64)
+    while iteration < max_iterations:
+        iteration += 1
+
+        any_over = False
+        for i in range(n):
+            loads[i] = current_load[rows[i]]
+            over[i] = loads[i] >= threshold
+            any_over = any_over or over[i]
+        if not any_over:
+            success = True
+            break
+
+        # top K by key, equal keys in position order
+        k = min(top_k, eligible.shape[0])
+        if k <= 0:
+            break
+        for e in range(eligible.shape[0]):
+            r = rows[eligible[e]]
+            keys[e] = reliability[r] if by_reliability else -current_load[r]
+        order = _top_k(keys, k)
+
+        delta[:] = 0.0
+        for s in range(k):
+            src = eligible[order[s]]
+            Lk = loads[src]
+            if Lk <= 0.0:
+                continue
+            start = nk_offsets[src]
+            stop = nk_offsets[src + 1]
+            denom = 0.0
+            for p in range(start, stop):
+                denom += deg_pow[nk_indices[p]]
+            if denom <= 0.0:
+                for p in range(start, stop):
+                    delta[nk_indices[p]] += Lk / (stop - start)
+            else:
+                for p in range(start, stop):
+                    j = nk_indices[p]
+                    delta[j] += Lk * (deg_pow[j] / denom)
+        for s in range(k):
+            src = eligible[order[s]]
+            loads[src] -= loads[src]
+
+        moved = False
+        for i in range(n):
+            r = rows[i]
+            load = loads[i] + delta[i]
+            extra = load - base_load[i]
+            cumulative_request_load[r] = 0.0 if extra <= 0.0 else extra
+            changed = load != current_load[r]
+            current_load[r] = load
+            if not changed:
+                # outside the sources' neighbourhoods nothing else changes
+                continue
+            moved = True
+            cap = bandwidth_capacity[r]
+            load_pct[r] = (load / cap) * 100 if cap > 0 else 0.0
+            if by_reliability:
+                # the next iteration selects by it
+                reliability[r] = math.exp(-(base_lambda[r] * load ** alpha[r]) * operational_time[r])
+        redistributed += 1
+        if not moved:
+            break
+
+    if redistributed > 0 and not by_reliability:
+        for i in range(n):
+            r = rows[i]
+            reliability[r] = math.exp(-(base_lambda[r] * current_load[r] ** alpha[r]) * operational_time[r])
+    return iteration, redistributed, success
+
+
+def _reliability_numpy(rows, operational_time, current_load, base_lambda, alpha, reliability):
+    reliability[rows] = reliability_R(operational_time[rows], current_load[rows], base_lambda[rows], alpha[rows])
+
+
+def _step_numpy(rows, base_load, endpoints, incoming_requests, cumulative_request_load,
+                operational_time, current_load, bandwidth_capacity, load_pct, reliability,
+                base_lambda, alpha, dt, threshold, over):
+    cumulative_request_load[rows] += incoming_requests[rows] * endpoints * 0.1
+    operational_time[rows] += dt
+
+    loads = np.maximum(0, base_load + cumulative_request_load[rows])
+    current_load[rows] = loads
+
+    caps = bandwidth_capacity[rows]
+    pct = np.zeros_like(loads)
+    np.divide(loads, caps, out=pct, where=caps > 0)
+    load_pct[rows] = pct * 100
+    reliability[rows] = reliability_R(operational_time[rows], loads, base_lambda[rows], alpha[rows])
+    return np.greater_equal(loads, threshold, out=over)
+
+
+if njit is not None:
+    # fastmath is left off so results match the NumPy path exactly
+    _step_serial = njit(cache=True)(_step_loop)
+    _step_parallel = njit(cache=True, parallel=True)(_step_loop)
+
+    def step(rows, *args):
+        kernel = _step_parallel if rows.shape[0] >= PARALLEL_MIN_ROWS else _step_serial
+        return kernel(rows, *args)
+
+    _reliability_serial = njit(cache=True)(_reliability_loop)
+    _reliability_parallel = njit(cache=True, parallel=True)(_reliability_loop)
+
+    def update_reliability(rows, *args):
+        kernel = _reliability_parallel if rows.shape[0] >= PARALLEL_MIN_ROWS else _reliability_serial
+        kernel(rows, *args)
+
+    _top_k = njit(cache=True)(_top_k_loop)
+    redistribution_loop = njit(cache=True)(_redistribution_loop)
+else:
+    _top_k = _top_k_loop
+    step = _step_numpy
+    update_reliability = _reliability_numpy
+    redistribution_loop = None
+
+
+def warmup():
+    """Compile (or load from the on-disk cache) the kernels before the first real tick."""
+    rows = np.zeros(0, dtype=np.intp)
+    empty = np.zeros(0, dtype=np.float64)
+    step_args = (rows,) + (empty,) * 11 + (0.5, 0.0, np.zeros(0, dtype=np.bool_))
+    reliability_args = (rows,) + (empty,) * 5
+    nk = np.zeros(1, dtype=np.int32)
+    redistribution_args = ((rows, empty, rows, nk, nk) + (empty,) * 9 +
+                           (True, 1, 0.0, 4, empty, np.zeros(0, dtype=np.bool_)))
+    if njit is not None:
+        for kernel, args in ((_step_serial, step_args), (_step_parallel, step_args),
+                             (_reliability_serial, reliability_args), (_reliability_parallel, reliability_args),
+                             (redistribution_loop, redistribution_args)):
+            kernel(*args)
+    else:
+        step(*step_args)
+
+
+if __name__ == "__main__":
+    rows = np.arange(3, dtype=np.intp)
+    cum = np.zeros(3)
+    op_time = np.zeros(3)
+    load = np.zeros(3)
+    pct = np.zeros(3)
+    reli = np.ones(3)
+    over = np.zeros(3, dtype=np.bool_)
+    for _ in range(10):
+        step(rows, np.array([25.0, 40.0, 5.0]), np.array([1.0, 2.0, 0.0]), np.ones(3), cum, op_time,
+             load, np.full(3, 1000.0), pct, reli, np.full(3, 3e-6), np.ones(3), 0.5, 30.0, over)
+    print(load, pct, reli, over)
@@ -2,39 +2,60 @@
 Simulation engine (Section 6)
 Runs mission time 0..2500 hours, increases Sw2 load, checks threshold, triggers redistribution per scheme.
 """
-from copy import deepcopy
 from san_topology import SANTopology
 import aftm_model as aftm
-from load_redistribution import proportional_redistribute_sources_full, proportional_redistribute_sources_per_paper
+from load_redistribution import proportional_redistribute_sources_full, proportional_redistribute_sources_per_paper, precompute_nk
 from mitigation_schemes import MitigationScheme
 from reliability_bdd import system_reliability
 import math
 import csv
 import os
 
+import numpy as np
+
 
 class Simulation:
+    # neighbors as specified in Figure 1 mesh (switch-to-switch neighbors only)
+    NEIGHBORS_MAP = {
+        "Sw1": ["Sw4"],
+        "Sw2": ["Sw4", "Sw5"],
+        "Sw3": ["Sw5"],
+        "Sw4": ["Sw1", "Sw2"],
+        "Sw5": ["Sw2", "Sw3"],
+    }
+
     def __init__(self, topo=None, alpha=1.0, beta=1.0, mission_time=2500):
         self.topo = topo or SANTopology()
         self.alpha = float(alpha)
         self.beta = float(beta)
         self.mission_time = int(mission_time)
+        # Nk per switch only depends on the mesh, so build it once for every redistribution
+        self.nk_map = precompute_nk(self.NEIGHBORS_MAP)
+
+    def _switch_lambdas(self, loads):
+        """Return the AFTM rates lambda(L) of all switches (in `topo.switches` order) for `loads`"""
+        switches = self.topo.switches
+        L = np.fromiter((loads.get(sw, 0.0) for sw in switches), dtype=np.float64, count=len(switches))
+        base_lam = np.fromiter((self.topo.base_lambda.get(sw, 0.0) for sw in switches), dtype=np.float64, count=len(switches))
+        return aftm.precompute_lambda(L, base_lam, alpha=self.alpha)
+
+    def _compute_all_reliabilities(self, t, loads, lam=None):
+        """Return dict of reliabilities for Sw1..Sw5, Sr1,Sr2, Sa1,Sa2 at time t
 
-    def _compute_all_reliabilities(self, t, loads):
-        """Return dict of reliabilities for Sw1..Sw5, Sr1,Sr2, Sa1,Sa2 at time t"""
-        reli = {}
-        # switches via AFTM
-        for sw in self.topo.switches:
-            L = loads.get(sw, 0.0)
-            base_lam = self.topo.base_lambda.get(sw, 0.0)
-            reli[sw] = aftm.reliability_R(t, L, base_lam, alpha=self.alpha)
+        `lam` may carry the switch rates from `_switch_lambdas(loads)` when they are already known.
+        """
+        # switches via AFTM, evaluated for all switches in one vectorized call
+        if lam is None:
+            lam = self._switch_lambdas(loads)
+        reli = dict(zip(self.topo.switches, aftm.reliability_from_lam(t, lam).tolist()))
 
         # servers and arrays exponential with constant lambda
         lam_sa = self.topo.server_array_lambda
-        reli["Sr1"] = math.exp(-lam_sa * t)
-        reli["Sr2"] = math.exp(-lam_sa * t)
-        reli["Sa1"] = math.exp(-lam_sa * t)
-        reli["Sa2"] = math.exp(-lam_sa * t)
+        R_sa = math.exp(-lam_sa * t)
+        reli["Sr1"] = R_sa
+        reli["Sr2"] = R_sa
+        reli["Sa1"] = R_sa
+        reli["Sa2"] = R_sa
 
         return reli
 
@@ -47,6 +68,7 @@ class Simulation:
         """
         scheme = MitigationScheme(scheme_id, initial_threshold=50.0, s=s_dynamic, top_k=3)
         topo = self.topo.copy()
+        scheme.set_switch_index({sw: i for i, sw in enumerate(topo.switches)})
         topo.reset_loads()
 
         # track number of redistributions performed
@@ -58,37 +80,45 @@ class Simulation:
         # we'll iterate time until we have 3 redistributions or reach mission_time
         t = 0
         # ensure loads start as L0 except Sw2 which is absolute L_sw2(t)=0.05*t
-        loads = deepcopy(topo.L0)
+        loads = dict(topo.L0)
 
         # Records for formatted output
         records = []
 
+        # switch loads -> AFTM rates of the last redistribution result; sequential redistributions
+        # start from the loads the previous one produced, so its rates can be reused
+        lam_cache = {}
+        # Φ of every redistribution index, selected once per trigger
+        all_sources = []
+
+        def switch_lambdas(loads_dict):
+            key = tuple(loads_dict.get(sw, 0.0) for sw in topo.switches)
+            lam = lam_cache.get(key)
+            if lam is None:
+                lam_cache.clear()
+                lam = lam_cache[key] = self._switch_lambdas(loads_dict)
+            return lam
+
         # Function to perform one redistribution at current time t
         def perform_redistribution(current_t, threshold, loads_dict):
             nonlocal redis_count
             # compute reliabilities before
-            reli_before = self._compute_all_reliabilities(current_t, loads_dict)
+            reli_before = self._compute_all_reliabilities(current_t, loads_dict, switch_lambdas(loads_dict))
             # SAN reliability before
             R_before = system_reliability(reli_before)
 
             # select sources (Φ) whose full loads will be redistributed
-            # pass the upcoming redistribution index so selection can be deterministic per redistribution
+            # the Φ sets are deterministic per redistribution index; past the last one the last set repeats
             upcoming_index = redis_count + 1
-            sources = scheme.select_sources(loads_dict, {k: reli_before[k] for k in topo.switches}, "Sw2", topo.switches, redis_index=upcoming_index)
+            if not all_sources:
+                all_sources.extend(scheme.select_all_sources(loads_dict, {k: reli_before[k] for k in topo.switches}, "Sw2", topo.switches))
+            sources = all_sources[min(upcoming_index, len(all_sources)) - 1]
             # perform redistribution per-paper: per-source Nk (switch neighbors only)
-            # neighbors as specified in Figure 1 mesh (switch-to-switch neighbors only):
-            neighbors_map = {
-                "Sw1": ["Sw4"],
-                "Sw2": ["Sw4", "Sw5"],
-                "Sw3": ["Sw5"],
-                "Sw4": ["Sw1", "Sw2"],
-                "Sw5": ["Sw2", "Sw3"],
-            }
             # Sw2 must be redistributed excess-only: pass current threshold
-            new_loads = proportional_redistribute_sources_per_paper(loads_dict, topo.degrees, sources, neighbors_map, beta=self.beta, sw2_threshold=current_threshold)
+            new_loads = proportional_redistribute_sources_per_paper(loads_dict, topo.degrees, sources, self.NEIGHBORS_MAP, beta=self.beta, sw2_threshold=current_threshold, nk_map=self.nk_map)
 
             # compute reliabilities after (same t)
-            reli_after = self._compute_all_reliabilities(current_t, new_loads)
+            reli_after = self._compute_all_reliabilities(current_t, new_loads, switch_lambdas(new_loads))
             R_after = system_reliability(reli_after)
 
             # compute IR
@@ -126,6 +156,7 @@ class Simulation:
             current_threshold = scheme.threshold()
 
             if loads["Sw2"] >= current_threshold:
+                all_sources.clear()
                 if scheme_id in (1, 2):
                     # static schemes: perform three sequential redistributions at this t
                     while redis_count < 3:
@@ -0,0 +1,118 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+import network_simulator as ns
+
+
+class ComponentTableReuseTest(unittest.TestCase):
+    """Rows of cleared components go back to the shared ComponentTable."""
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        cwd = os.getcwd()
+        tmp = tempfile.TemporaryDirectory()
+        os.chdir(tmp.name)
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, cwd)
+        # clear_all asks for confirmation
+        patcher = mock.patch.object(QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.sim = ns.NetworkSimulator()
+        self.addCleanup(self.sim.close)
+
+    def test_reload_keeps_table_rows_stable(self):
+        for component_type in (ns.ComponentType.SERVER, ns.ComponentType.SWITCH, ns.ComponentType.SWITCH):
+            self.sim.add_component(component_type)
+        server, switch_a, switch_b = self.sim.components
+        for a, b in ((server, switch_a), (switch_a, switch_b)):
+            self.sim.components[a].connect_to(b)
+            self.sim.components[b].connect_to(a)
+        self.sim.save_configuration()
+
+        self.sim.load_configuration()
+        size = ns.NetworkComponent.table.size
+        for _ in range(5):
+            self.sim.load_configuration()
+        self.app.processEvents()
+
+        self.assertEqual(ns.NetworkComponent.table.size, size)
+        self.assertEqual(sorted(self.sim.components), sorted([server, switch_a, switch_b]))
+        # 20 per connected server + 5 per connected switch
+        self.assertEqual(self.sim.components[switch_a].current_load, 25)
+
+    def test_clear_all_releases_zeroed_rows(self):
+        self.sim.add_component(ns.ComponentType.SWITCH)
+        row = next(iter(self.sim.components.values()))._row
+        self.sim.update_statistics()
+        self.sim._flush_stats()
+        self.assertEqual(self.sim.stats_model.rowCount(), 1)
+        self.sim.clear_all()
+
+        # the stats table no longer shows (or edits) the cleared switch
+        self.assertEqual(self.sim.stats_model.rowCount(), 0)
+        table = ns.NetworkComponent.table
+        self.assertIn(row, table.free_rows)
+        self.assertEqual(table.reliability[row], 0)
+        self.assertEqual(ns.NetworkComponent.create(ns.ComponentType.SERVER)._row, row)
+
+
+class ImbalanceGateTest(unittest.TestCase):
+    """The abs/rel imbalance gate keeps evenly loaded switches from being redistributed."""
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.sim = ns.NetworkSimulator()
+        self.addCleanup(self.sim.close)
+        for component_type in (ns.ComponentType.SERVER, ns.ComponentType.SERVER, ns.ComponentType.SERVER,
+                               ns.ComponentType.SWITCH, ns.ComponentType.SWITCH):
+            self.sim.add_component(component_type)
+        self.server_a, self.server_b, self.server_c, self.switch_a, self.switch_b = self.sim.components
+        self.connect(self.server_a, self.switch_a)
+        self.connect(self.server_b, self.switch_b)
+        self.sim.threshold_spinbox.setValue(1)
+        self.sim.abs_imbalance_spinbox.setValue(10)
+        self.sim.rel_imbalance_spinbox.setValue(1.5)
+        patcher = mock.patch.object(self.sim, "_redistribute")
+        self.redistribute = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def connect(self, a, b):
+        self.sim.components[a].connect_to(b)
+        self.sim.components[b].connect_to(a)
+        self.sim._schedule_recalc()
+
+    def test_balanced_tick_skips_redistribution(self):
+        self.sim.run_simulation_step()
+
+        self.assertEqual(self.sim.components[self.switch_a].current_load,
+                         self.sim.components[self.switch_b].current_load)
+        self.redistribute.assert_not_called()
+        self.assertTrue(self.sim.components[self.switch_a].over_threshold)
+
+    def test_imbalanced_tick_redistributes(self):
+        self.connect(self.server_c, self.switch_a)
+        self.sim.run_simulation_step()
+
+        self.redistribute.assert_called_once_with()
+
+    def test_off_values_disable_the_gate(self):
+        self.sim.abs_imbalance_spinbox.setValue(0)
+        self.sim.rel_imbalance_spinbox.setValue(1.0)
+        self.assertIsNone(self.sim.abs_imbalance_threshold)
+        self.assertIsNone(self.sim.rel_imbalance_threshold)
+        self.sim.run_simulation_step()
+
+        self.redistribute.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()